@@ -1,5 +1,12 @@
+from viper import Host
+from viper import Hosts
 from viper.cli import func
+from viper.cli_base import collect_items
+from viper.cli_base import read_items
+from viper.cli_base import write_items
 
+import io
+import os
 import pytest
 import subprocess
 
@@ -20,3 +27,64 @@ def test_print_usage():
 
     assert p.returncode == 1
     assert "usage: viper" in out.decode()
+
+
+def test_read_items(monkeypatch):
+    hosts = Hosts.from_items(Host("1.1.1.1"), Host("2.2.2.2"))
+
+    monkeypatch.setattr("sys.stdin", io.StringIO(hosts.to_json(indent=4)))
+    chunks, stream = read_items(Hosts)
+    assert not stream
+    assert list(chunks) == [hosts]
+
+    lines = "\n".join(h.to_json() for h in hosts.all())
+    monkeypatch.setattr("sys.stdin", io.StringIO(lines + "\n\n"))
+    chunks, stream = read_items(Hosts)
+    assert stream
+    assert list(chunks) == [Hosts.from_items(h) for h in hosts.all()]
+
+    monkeypatch.setattr("sys.stdin", io.StringIO(lines))
+    assert collect_items(Hosts) == (hosts, True)
+
+
+def test_write_items(capsys):
+    hosts = Hosts.from_items(Host("1.1.1.1"), Host("2.2.2.2"))
+
+    write_items(hosts, False)
+    assert capsys.readouterr().out == hosts.to_json() + "\n"
+
+    write_items(hosts, True)
+    assert capsys.readouterr().out.splitlines() == [
+        h.to_json() for h in hosts.all()
+    ]
+
+
+def test_stream_pipeline():
+    hosts = Hosts.from_items(Host("1.1.1.1"), Host("2.2.2.2"), Host("3.3.3.3"))
+    lines = "".join(h.to_json() + "\n" for h in hosts.all())
+
+    p = subprocess.run(
+        ["viper", "hosts:head", "-n", "2"], input=lines.encode(), capture_output=True
+    )
+    assert p.returncode == 0
+    assert p.stdout.decode().splitlines() == [h.to_json() for h in hosts.all()[:2]]
+
+    p = subprocess.run(
+        ["viper", "hosts:order-by", "ip", "--reverse"],
+        input=lines.encode(),
+        capture_output=True,
+    )
+    assert p.stdout.decode().splitlines() == [
+        h.to_json() for h in reversed(hosts.all())
+    ]
+
+    p = subprocess.run(
+        ["viper", "hosts:where", "ip", "IS_NOT", "2.2.2.2"],
+        input=hosts.to_json().encode(),
+        capture_output=True,
+        env=dict(os.environ, VIPER_STREAM="1"),
+    )
+    assert p.stdout.decode().splitlines() == [
+        hosts.all()[0].to_json(),
+        hosts.all()[2].to_json(),
+    ]
@@ -1,3 +1,9 @@
+from viper.db import check_schema
+from viper.db import insert_results
+from viper.db import ResultSink
+from viper.db import SCHEMA_VERSION
+from viper.db import schema_version
+from viper.db import select_results
 from viper.db import ViperDB
 
 import os
@@ -42,3 +48,140 @@ def test_viper_db_insert():
         data = next(conn.execute("SELECT id, task FROM results"))
 
     assert data == (1, "foo")
+
+
+def test_result_sink():
+
+    ViperDB.init(DB_URL, force=True)
+
+    row = (999, 1.2, "foo", "2", "bar", "3", "4", "5", 6, 7, 8, 9, "1.1", None, "foo")
+
+    with ResultSink(DB_URL, batch_size=2, flush_interval=60) as sink:
+        for _ in range(3):
+            sink.put(row)
+
+    with ViperDB(DB_URL) as conn:
+        assert next(conn.execute("SELECT COUNT(*) FROM results")) == (3,)
+
+    with pytest.raises(RuntimeError) as e:
+        sink.put(row)
+    assert "not started" in str(vars(e))
+
+    with pytest.raises(ValueError) as e:
+        ResultSink(DB_URL, batch_size=0).start()
+    assert "batch size must be >= 1" in str(vars(e))
+
+
+def test_result_sink_error():
+
+    ViperDB.init(DB_URL, force=True)
+
+    sink = ResultSink(DB_URL)
+    sink.start()
+    sink.put(("invalid", "row"))
+
+    with pytest.raises(RuntimeError) as e:
+        sink.close()
+    assert "failed to save the results" in str(vars(e))
+
+
+def test_viper_db_migrate():
+
+    if os.path.exists(DB_URL):
+        os.remove(DB_URL)
+
+    with ViperDB(DB_URL) as conn:
+        with pytest.raises(RuntimeError) as e:
+            check_schema(conn)
+        assert "database is not initialized" in str(vars(e))
+
+        # The schema before versioning
+        conn.execute(
+            """
+            CREATE TABLE results (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                hash INTEGER NOT NULL,
+                trigger_time REAL NOT NULL,
+                task JSON NOT NULL,
+                host JSON NOT NULL,
+                args JSON NOT NULL,
+                command JSON NOT NULL,
+                stdout BLOB NOT NULL,
+                stderr BLOB NOT NULL,
+                returncode INTEGER NOT NULL,
+                start REAL NOT NULL,
+                end REAL NOT NULL,
+                retry INTEGER NOT NULL
+            );
+            """
+        )
+        conn.execute(
+            """
+            INSERT INTO results (
+                hash, trigger_time, task, host, args, command, stdout,
+                stderr, returncode, start, end, retry
+            ) VALUES (
+                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+            )
+            """,
+            (999, 1.2, '{"name": "foo"}', '{"ip": "1.1.1.1"}', "[]", "[]")
+            + ("", "", 0, 7, 8, 0),
+        )
+
+    with ViperDB(DB_URL) as conn:
+        with pytest.raises(RuntimeError) as e:
+            check_schema(conn)
+        assert "database schema is outdated" in str(vars(e))
+
+    assert ViperDB.migrate(DB_URL) == (0, SCHEMA_VERSION)
+    assert ViperDB.migrate(DB_URL) == (SCHEMA_VERSION, SCHEMA_VERSION)
+
+    with ViperDB(DB_URL) as conn:
+        assert schema_version(conn) == SCHEMA_VERSION
+        data = next(
+            conn.execute("SELECT host_ip, host_hostname, task_name FROM results")
+        )
+        plan = " ".join(
+            str(r)
+            for r in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM results WHERE host_ip = ?", ("x",)
+            )
+        )
+
+    assert data == ("1.1.1.1", None, "foo")
+    assert "INDEX results_host_ip (host_ip=?)" in plan
+
+
+def test_result_sink_normalized_layout():
+
+    ViperDB.init(DB_URL, force=True)
+
+    rows = [
+        (999, 1.2, '{"name": "foo"}', '{"ip": "1.1"}', "[]", "[]", "4", "5", 6, 7, 8)
+        + (9, "1.1", None, "foo"),
+        (999, 1.2, '{"name": "foo"}', '{"ip": "2.2"}', "[]", "[]", "4", "5", 6, 7, 8)
+        + (9, "2.2", None, "foo"),
+    ]
+
+    with ResultSink(DB_URL, layout="normalized") as sink:
+        for row in rows:
+            sink.put(row)
+
+    with ResultSink(DB_URL, layout="inline") as sink:
+        sink.put(rows[0])
+
+    with ViperDB(DB_URL) as conn:
+        assert next(conn.execute("SELECT COUNT(*) FROM tasks")) == (1,)
+        assert next(conn.execute("SELECT COUNT(*) FROM hosts")) == (2,)
+        assert next(
+            conn.execute("SELECT COUNT(*) FROM results WHERE task IS NULL")
+        ) == (2,)
+
+        selected = [r[2:4] for r in select_results(conn, order_by="id")]
+
+    assert selected == [r[2:4] for r in rows + [rows[0]]]
+
+    with ViperDB(DB_URL) as conn:
+        with pytest.raises(ValueError) as e:
+            insert_results(conn, rows, layout="foo")
+        assert "invalid layout" in str(vars(e))
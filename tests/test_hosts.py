@@ -1,10 +1,12 @@
 from tests.const import TEST_DATA_DIR
 from unittest import mock
+from viper import Engines
 from viper import Host
 from viper import Hosts
 from viper import meta
 from viper import Results
 from viper import Runner
+from viper import Where
 from viper import WhereConditions
 from viper.collections import Item
 from viper.db import ViperDB
@@ -131,6 +133,47 @@ def test_hosts_where():
     assert "expecting enum" in str(e.__dict__)
 
 
+def test_hosts_where_query():
+    hosts = Hosts.from_items(
+        Host("1.1.1.1", port=22, meta=meta(dc="dc1")),
+        Host("2.2.2.2", port=2222, meta=meta(dc="dc2")),
+        Host("3.3.3.3", port=8022, meta=meta(dc="dc1")),
+    )
+
+    def ips(query):
+        return [h.ip for h in hosts.where(query).all()]
+
+    assert ips(Where("port", WhereConditions.gt, ["22"])) == ["2.2.2.2", "3.3.3.3"]
+    assert ips(Where("port", WhereConditions.le, ["2222"])) == ["1.1.1.1", "2.2.2.2"]
+    assert ips(Where("port", WhereConditions.between, ["23", "8022"])) == [
+        "2.2.2.2",
+        "3.3.3.3",
+    ]
+    assert ips(Where("meta.dc", WhereConditions.is_, "dc1")) == ["1.1.1.1", "3.3.3.3"]
+    assert ips(Where("meta[dc]", WhereConditions.lt, ["1"])) == []
+
+    dc1 = Where("meta.dc", WhereConditions.is_, ["dc1"])
+    assert ips(dc1 & Where("port", WhereConditions.ge, ["8022"])) == ["3.3.3.3"]
+    assert ips(
+        Where("ip", WhereConditions.startswith, ["2.", "9."])
+        | dc1 & Where("port", WhereConditions.lt, ["1000"])
+    ) == ["1.1.1.1", "2.2.2.2"]
+
+    assert hosts.where("port", WhereConditions.ge, ["2222"]) == hosts.where(
+        Where("port", WhereConditions.ge, ["2222"])
+    )
+
+    with pytest.raises(ValueError) as e:
+        Where("port", WhereConditions.between, ["1"])
+
+    assert "expecting 2 value(s)" in str(e.__dict__)
+
+    with pytest.raises(ValueError) as e:
+        hosts.where("port", WhereConditions.gt, ["abc"])
+
+    assert "expecting numbers" in str(e.__dict__)
+
+
 def test_hosts_filter():
     assert Hosts.from_file(CSV_FILE).filter(
         lambda h: h.ip.startswith("1.")
@@ -197,7 +240,9 @@ def test_hosts_run_task(Runners, Task):
 
     hosts.run_task(task, max_workers=3)
 
-    Runners.from_items().run.assert_called_with(max_workers=3)
+    Runners.from_items().run.assert_called_with(
+        max_workers=3, engine=Engines.thread, processes=1
+    )
 
     assert hosts.results() == Results.from_items()
 
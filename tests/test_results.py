@@ -1,9 +1,16 @@
 from viper import Host
+from viper import Hosts
+from viper import meta
 from viper import Result
 from viper import Results
 from viper import Runner
 from viper import Runners
 from viper import Task
+from viper import Where
+from viper import WhereConditions
+from viper.db import ViperDB
+
+import pytest
 
 
 def make_echo_command(host, what):
@@ -116,3 +123,80 @@ def test_results_final():
 
     final = Results.from_items(*result_list).final().sort()
     assert final == Results.from_items(result_list[1], result_list[2]).sort()
+
+
+def test_results_from_history():
+
+    ViperDB.init(ViperDB.url, force=True)
+
+    task = Task("print IP address", command_factory=make_echo_command)
+    hosts = Hosts.from_items(Host("1.1.1.1"), Host("2.2.2.2"))
+
+    first = hosts.task(task, "foo").run()
+    second = hosts.task(task, "bar").run()
+    since = second.all()[0].trigger_time
+
+    history = Results.from_history()
+    assert history.sort() == Results.from_items(first.all(), second.all()).sort()
+    assert history.all()[0].task is history.all()[-1].task
+
+    assert Results.from_history(since=since).sort() == second.sort()
+    assert Results.from_history(until=since).sort() == first.sort()
+    assert Results.from_history(limit=3).count() == 3
+    assert Results.from_history(offset=3).count() == 1
+    assert Results.from_history(limit=1, offset=1).all() == history.range(1, 2).all()
+
+    assert Results.by_host(Host("1.1.1.1")).count() == 2
+    assert Results.by_host(Host("1.1.1.1"), since=since).all() == (
+        second.where("host.ip", WhereConditions.is_, ["1.1.1.1"]).all()
+    )
+    assert Results.by_task(task, limit=1).count() == 1
+
+    with ViperDB() as conn:
+        id_ = next(conn.execute("SELECT MAX(id) FROM results"))[0]
+
+    assert Result.by_id(id_) == history.all()[0]
+
+    with pytest.raises(ValueError) as e:
+        Result.by_id(id_ + 1)
+    assert "result not found" in str(vars(e))
+
+
+def test_results_from_history_query():
+
+    ViperDB.init(ViperDB.url, force=True)
+
+    task = Task("print IP address", command_factory=make_echo_command)
+    hosts = Hosts.from_items(
+        Host("1.1.1.1", meta=meta(dc="dc1", rack=1)),
+        Host("2.2.2.2", hostname="web", meta=meta(dc="dc2", rack=2.5)),
+        Host("3.3.3.3", meta=meta(dc="dc1", rack=3)),
+    )
+    hosts.task(task, "foo").run()
+    hosts.task(task, "bar").run()
+    history = Results.from_history()
+
+    queries = [
+        Where("host.ip", WhereConditions.is_not, ["2.2.2.2"]),
+        Where("stdout", WhereConditions.startswith, ["fo", "x"]),
+        Where("host.hostname", WhereConditions.is_, ["None"]),
+        Where("host.meta.dc", WhereConditions.is_, ["dc1"]),
+        Where("host.meta.rack", WhereConditions.between, ["2", "3"]),
+        Where("host.meta.rack", WhereConditions.contains, ["."]),
+        Where("returncode", WhereConditions.lt, ["1"])
+        & Where("args", WhereConditions.contains, ["bar"]),
+        Where("host.ip", WhereConditions.endswith, ["1"])
+        | Where("task.name", WhereConditions.not_contains, ["IP"]),
+    ]
+    for query in queries:
+        assert Results.from_history(where=query).all() == history.where(query).all()
+        assert (
+            Results.from_history(where=query, limit=1, offset=1).all()
+            == history.where(query).range(1, 2).all()
+        )
+
+    for order_by in (["host.ip", "stdout"], ["host.meta.rack"]):
+        assert (
+            Results.from_history(order_by=order_by, reverse=True, limit=4).all()
+            == history.order_by(*order_by, reverse=True).head(4).all()
+        )
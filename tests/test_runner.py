@@ -2,6 +2,7 @@ from viper import Host
 from viper import Runner
 from viper import Task
 
+import asyncio
 import pytest
 
 
@@ -108,3 +109,39 @@ def test_tasks_runner_retry():
     task = Task("Fail", command_factory=make_failing_command, retry=1)
 
     assert host.task(task).run().retry == 1
+
+
+def make_sleep_command(host):
+    return ("sleep", "5")
+
+
+def test_runner_run_async():
+    host = Host("1.1.1.1")
+    task = Task(
+        "print IP address",
+        command_factory=make_echo_command,
+        stdout_processor=process_stdout,
+        stderr_processor=process_stderr,
+    )
+
+    result = asyncio.run(host.task(task).run_async())
+
+    assert result.command == ("echo", "foo")
+    assert result.stdout == "output: foo\n"
+    assert result.stderr == "error: "
+    assert result.returncode == 0
+    assert result.end > result.start
+
+
+def test_runner_run_async_retry_and_timeout():
+    host = Host("1.1.1.1")
+
+    task = Task("Fail", command_factory=make_failing_command, retry=1)
+    assert asyncio.run(host.task(task).run_async()).retry == 1
+
+    task = Task("Timeout", command_factory=make_sleep_command, timeout=0.1)
+    result = asyncio.run(host.task(task).run_async())
+
+    assert result.returncode == 123
+    assert "timed out after 0.1 seconds" in result.stderr
+    assert result.end - result.start < 5
@@ -1,7 +1,10 @@
+from viper import Engines
 from viper import Host
 from viper import Hosts
+from viper import Results
 from viper import Runner
 from viper import Task
+from viper.db import ViperDB
 
 
 def make_command(host):
@@ -95,3 +98,79 @@ def test_runners_run_in_parallel():
     assert result.ok()
     assert not result.errored()
     assert results.hosts() == hosts
+
+
+def test_runners_run_saves_results():
+    hosts = Hosts.from_items(Host("1.1.1.1"), Host("2.2.2.2"), Host("3.3.3.3"))
+    task = Task("print IP address", command_factory=make_command)
+
+    results = hosts.task(task).run(max_workers=2)
+    trigger_time = results.all()[0].trigger_time
+
+    with ViperDB() as conn:
+        rows = conn.execute(
+            "SELECT COUNT(*) FROM results WHERE trigger_time = ?", (trigger_time,)
+        )
+        assert next(rows) == (3,)
+
+
+def test_runners_run_asyncio_engine():
+    hosts = Hosts.from_items(Host("1.1.1.1"), Host("2.2.2.2"), Host("3.3.3.3"))
+    task = Task(
+        "print IP address",
+        command_factory=make_command,
+        stdout_processor=process_stdout,
+        pre_run=pre_run,
+        post_run=post_run,
+    )
+
+    results = hosts.task(task).run(max_workers=2, engine=Engines.asyncio)
+
+    assert results.hosts().sort() == hosts.sort()
+    assert {r.stdout for r in results.all()} == {
+        f"output: {h.ip}\n" for h in hosts.all()
+    }
+    assert all(r.ok() for r in results.all())
+    assert results.sort() == Results.from_history(
+        since=results.all()[0].trigger_time
+    ).sort()
+
+
+def test_runners_run_processes():
+    hosts = Hosts.from_items(*(Host(f"1.1.1.{i}") for i in range(1, 6)))
+    task = Task(
+        "print IP address",
+        command_factory=make_command,
+        stdout_processor=process_stdout,
+    )
+
+    results = hosts.task(task).run(max_workers=2, processes=3)
+
+    assert results.hosts().sort() == hosts.sort()
+    assert {r.stdout for r in results.all()} == {
+        f"output: {h.ip}\n" for h in hosts.all()
+    }
+    assert len({r.trigger_time for r in results.all()}) == 1
+    assert results.sort() == Results.from_history(
+        since=results.all()[0].trigger_time
+    ).sort()
+
+
+def test_runners_iter_run():
+    hosts = Hosts.from_items(Host("1.1.1.1"), Host("2.2.2.2"), Host("3.3.3.3"))
+    task = Task(
+        "print IP address",
+        command_factory=make_command,
+        stdout_processor=process_stdout,
+    )
+    runners = hosts.task(task)
+
+    for engine in Engines:
+        results = runners.iter_run(max_workers=2, engine=engine)
+        assert not isinstance(results, Results)
+
+        results = Results.from_items(results)
+        assert results.hosts().sort() == hosts.sort()
+        assert results.sort() == Results.from_history(
+            since=results.all()[0].trigger_time
+        ).sort()
@@ -5,6 +5,7 @@ __homepage__ = "https://github.com/sayanarijit/viper"
 __license__ = "MIT"
 __version__ = "v0.28.3"
 
+from viper.collections import Engines  # noqa: F401
 from viper.collections import Host  # noqa: F401
 from viper.collections import Hosts  # noqa: F401
 from viper.collections import meta  # noqa: F401
@@ -13,10 +14,12 @@ from viper.collections import Results  # noqa: F401
 from viper.collections import Runner  # noqa: F401
 from viper.collections import Runners  # noqa: F401
 from viper.collections import Task  # noqa: F401
+from viper.collections import Where  # noqa: F401
 from viper.collections import WhereConditions  # noqa: F401
 
 __all__ = [
     "meta",
+    "Engines",
     "Host",
     "Hosts",
     "Result",
@@ -24,6 +27,7 @@ __all__ = [
     "Runner",
     "Runners",
     "Task",
+    "Where",
     "WhereConditions",
 ]
 __doc__ = f"""{__description__}
@@ -69,6 +73,13 @@ Viper needs to initialize a SQLite DB in the present working directory (the work
     viper init -f
 
 
+An existing workspace can be upgraded in place after upgrading viper:
+
+.. code-block:: bash
+
+    viper db:migrate
+
+
 Viper in Action (Basic Mode)
 ^^^^^^^^^^^^^^^^^^^^^^^^^^^^
 
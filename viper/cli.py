@@ -96,6 +96,29 @@ The above CLI example is equivalent to the following Python example:
 .. tip:: Refer to :doc:`getting_started` to see how ``task.ping`` and ``hosts.csv`` are written.
 
 
+Example: Streaming the Results
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+By default each subcommand reads the whole JSON collection from the
+standard input and writes the whole collection when it is done. With the
+``--stream`` option (or ``VIPER_STREAM=1`` in the environment), the items are
+written one JSON object per line (NDJSON) as soon as they are available, e.g.
+``runners:run`` and ``hosts:run-task`` write each result as it completes.
+
+The subcommands detect such input by themselves and keep streaming it. The
+item-wise subcommands such as ``*:where``, ``*:filter``, ``*:format``,
+``*:head`` and ``*:hosts`` process one item at a time, while the ones that
+need all the items, such as ``*:order-by``, ``*:sort``, ``*:tail`` and
+``results:final``, read everything before writing.
+
+.. code-block:: bash
+
+    viper hosts:from-file("hosts.csv") \\
+            | viper hosts:run-task task.ping --max-workers 50 --stream \\
+            | viper results:where returncode IS_NOT 0 \\
+            | viper results:format "{host.hostname}: {stderr}"
+
+
 Defining Actions
 ^^^^^^^^^^^^^^^^
 
@@ -244,21 +267,35 @@ the ``*:order-by`` and ``*:where`` subcommands respectively.
 """
 
 
+from argparse import Action
 from argparse import ArgumentParser
 from argparse import Namespace
+from functools import reduce
+from itertools import islice
 from pydoc import locate
 from types import FunctionType
 from viper import __version__
+from viper import Engines
+from viper import Host
 from viper import Hosts
 from viper import Results
 from viper import Runners
 from viper import Task
+from viper.cli_base import add_stream_argument
+from viper.cli_base import collect_items
+from viper.cli_base import join_items
+from viper.cli_base import read_items
 from viper.cli_base import SubCommand
+from viper.cli_base import write_items
 from viper.collections import Collection as ViperCollection
+from viper.collections import Items as ViperItems
+from viper.collections import Query
+from viper.collections import Where
 from viper.collections import WhereConditions
 from viper.const import Config
 from viper.db import ViperDB
 
+import operator
 import os
 import sqlite3
 import sys
@@ -281,6 +318,75 @@ def func(objpath: str) -> FunctionType:
     return funcobj
 
 
+class WhereClauseAction(Action):
+    """Collect the ``--and`` and ``--or`` where clauses in the given order."""
+
+    def __call__(
+        self,
+        parser: ArgumentParser,
+        namespace: Namespace,
+        values: t.Any,
+        option_string: t.Optional[str] = None,
+    ) -> None:
+        if len(values) < 2:
+            parser.error(f"{option_string}: expecting KEY CONDITION [VALUES ...]")
+
+        try:
+            clause = Where(values[0], WhereConditions(values[1]), values[2:])
+        except ValueError as e:
+            parser.error(f"{option_string}: {e}")
+
+        clauses = list(getattr(namespace, self.dest) or [])
+        clauses.append((self.const, clause))
+        setattr(namespace, self.dest, clauses)
+
+
+def add_where_clause_arguments(parser: ArgumentParser, where: bool = False) -> None:
+    """Add the ``--and`` and ``--or`` options for the where queries.
+
+    :param bool where: Also add the ``--where`` option for the first clause.
+    """
+
+    ops = ("where", "and", "or") if where else ("and", "or")
+    for op in ops:
+        parser.add_argument(
+            f"--{op}",
+            nargs="+",
+            action=WhereClauseAction,
+            dest="clauses",
+            const="and" if op == "where" else op,
+            default=[],
+            metavar="ARG",
+            help=f"{op.upper()} another 'key condition [values ...]' clause"
+            + " (AND binds tighter than OR)",
+        )
+
+
+def where_query(
+    clauses: t.Sequence[t.Tuple[str, Query]], query: t.Optional[Query] = None
+) -> t.Optional[Query]:
+    """Combine the where clauses collected by the ``--and`` and ``--or`` options.
+
+    :param list clauses: The operators and the clauses in the given order.
+    :param viper.collections.Query query (optional): The first clause.
+    """
+
+    groups = []
+    for op, clause in clauses:
+        if query is None:
+            query = clause
+        elif op == "and":
+            query = query & clause
+        else:
+            groups.append(query)
+            query = clause
+
+    if query is not None:
+        groups.append(query)
+
+    return reduce(operator.or_, groups) if groups else None
+
+
 class AutocompleteCommand(SubCommand):
     """generate the auto completion script"""
 
@@ -339,6 +445,23 @@ class InitCommand(SubCommand):
         return 0
 
 
+class DBMigrateCommand(SubCommand):
+    """upgrade the database of the current workspace to the latest schema"""
+
+    name = "db:migrate"
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        pass
+
+    def __call__(self, args: Namespace) -> int:
+        old, new = ViperDB.migrate(ViperDB.url)
+        if old == new:
+            print(f"schema version {new} is up to date")
+        else:
+            print(f"migrated schema version {old} to {new}")
+        return 0
+
+
 class LetsCommand(SubCommand):
     """perform any defined action"""
 
@@ -365,14 +488,16 @@ class RunJobCommand(SubCommand):
         parser.add_argument("job", type=func, help="job definition location")
         parser.add_argument("args", nargs="*", help="arguments to be passed to the job")
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        results = args.job(Hosts.from_json(input()), *args.args)
+        items, stream = collect_items(Hosts)
+        results = args.job(items, *args.args)
         if not isinstance(results, Results):
             raise ValueError(
                 f"a job must return {Results} object but got {type(results)}"
             )
-        print(results.to_json(indent=args.indent))
+        write_items(results, stream or args.stream, indent=args.indent)
         return 0
 
 
@@ -400,9 +525,12 @@ class TaskResultsCommand(SubCommand):
 
     def add_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(Task.from_json(input()).results().to_json(indent=args.indent))
+        write_items(
+            Task.from_json(input()).results(), args.stream, indent=args.indent
+        )
         return 0
 
 
@@ -430,9 +558,10 @@ class HostsFromFuncCommand(SubCommand):
             "func", type=Hosts.from_func, help="load hosts from a Python function"
         )
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(args.func.to_json(indent=args.indent))
+        write_items(args.func, args.stream, indent=args.indent)
         return 0
 
 
@@ -444,9 +573,10 @@ class HostsFromFileCommand(SubCommand):
     def add_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("filepath")
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(Hosts.from_file(args.filepath).to_json(indent=args.indent))
+        write_items(Hosts.from_file(args.filepath), args.stream, indent=args.indent)
         return 0
 
 
@@ -458,11 +588,11 @@ class HostsToFileCommand(SubCommand):
     def add_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("filepath")
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(
-            Hosts.from_json(input()).to_file(args.filepath).to_json(indent=args.indent)
-        )
+        items, stream = collect_items(Hosts)
+        write_items(items.to_file(args.filepath), stream or args.stream, indent=args.indent)
         return 0
 
 
@@ -479,14 +609,12 @@ class HostsTaskCommand(SubCommand):
             "args", nargs="*", help="arguments to be passed to the command factory"
         )
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-
-        print(
-            Hosts.from_json(input())
-            .task(args.task, *args.args)
-            .to_json(indent=args.indent)
-        )
+        chunks, stream = read_items(Hosts)
+        for chunk in chunks:
+            write_items(chunk.task(args.task, *args.args), stream or args.stream, indent=args.indent)
         return 0
 
 
@@ -503,14 +631,33 @@ class HostsRunTaskCommand(SubCommand):
             "args", nargs="*", help="arguments to be passed to the command factory"
         )
         parser.add_argument("--max-workers", type=int, default=Config.max_workers.value)
+        parser.add_argument(
+            "--engine",
+            choices=[e.value for e in Engines],
+            default=Engines.thread.value,
+            help="the execution engine to use",
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=1,
+            help="number of worker processes to shard the runners across",
+        )
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(
-            Hosts.from_json(input())
-            .run_task(args.task, *args.args, max_workers=args.max_workers)
-            .to_json(indent=args.indent)
+        hosts, stream = collect_items(Hosts)
+        results = hosts.task(args.task, *args.args).iter_run(
+            max_workers=args.max_workers,
+            engine=Engines(args.engine),
+            processes=args.processes,
         )
+        if stream or args.stream:
+            for result in results:
+                print(result.to_json(), flush=True)
+        else:
+            print(Results.from_items(results).to_json(indent=args.indent))
         return 0
 
 
@@ -525,13 +672,12 @@ class HostsFilterCommand(SubCommand):
             "args", nargs="*", help="arguments to be passed to the filter"
         )
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(
-            Hosts.from_json(input())
-            .filter(args.filter, *args.args)
-            .to_json(indent=args.indent)
-        )
+        chunks, stream = read_items(Hosts)
+        for chunk in chunks:
+            write_items(chunk.filter(args.filter, *args.args), stream or args.stream, indent=args.indent)
         return 0
 
 
@@ -544,7 +690,8 @@ class HostsCountCommand(SubCommand):
         pass
 
     def __call__(self, args: Namespace) -> int:
-        print(Hosts.from_json(input()).count())
+        chunks, _ = read_items(Hosts)
+        print(sum(c.count() for c in chunks))
         return 0
 
 
@@ -561,12 +708,12 @@ class HostsOrderByCommand(SubCommand):
             "--reverse", action="store_true", help="reverse the order after sort"
         )
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(
-            Hosts.from_json(input())
-            .order_by(*args.properties, reverse=args.reverse)
-            .to_json(indent=args.indent)
+        items, stream = collect_items(Hosts)
+        write_items(
+            items.order_by(*args.properties, reverse=args.reverse), stream or args.stream, indent=args.indent,
         )
         return 0
 
@@ -582,13 +729,11 @@ class HostsSortCommand(SubCommand):
             "--reverse", action="store_true", help="reverse the order after sort"
         )
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(
-            Hosts.from_json(input())
-            .sort(key=args.key, reverse=args.reverse)
-            .to_json(indent=args.indent)
-        )
+        items, stream = collect_items(Hosts)
+        write_items(items.sort(key=args.key, reverse=args.reverse), stream or args.stream, indent=args.indent)
         return 0
 
 
@@ -603,13 +748,19 @@ class HostsPipeCommand(SubCommand):
             "args", nargs="*", help="arguments to be passed to the filter"
         )
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        obj: t.Any = Hosts.from_json(input()).pipe(args.handler, *args.args)
+        items, stream = collect_items(Hosts)
+        obj: t.Any = items.pipe(args.handler, *args.args)
 
         if obj is None:
             return 0
 
+        if isinstance(obj, ViperItems):
+            write_items(obj, stream or args.stream, indent=args.indent)
+            return 0
+
         if isinstance(obj, ViperCollection):
             print(obj.to_json(indent=args.indent))
             return 0
@@ -630,7 +781,10 @@ class HostsFormatCommand(SubCommand):
         )
 
     def __call__(self, args: Namespace) -> int:
-        print(Hosts.from_json(input()).format(args.template, sep=args.sep))
+        chunks, stream = read_items(Hosts)
+        for chunk in chunks:
+            # While streaming, each item is printed on its own line
+            print(chunk.format(args.template, sep=args.sep), flush=stream)
         return 0
 
 
@@ -645,14 +799,20 @@ class HostsWhereCommand(SubCommand):
             "condition", choices=[o.value for o in WhereConditions],
         )
         parser.add_argument("values", nargs="*")
+        add_where_clause_arguments(parser)
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(
-            Hosts.from_json(input())
-            .where(args.key, WhereConditions(args.condition), args.values)
-            .to_json(indent=args.indent)
+        query = where_query(
+            args.clauses, Where(args.key, WhereConditions(args.condition), args.values)
         )
+        chunks, stream = read_items(Hosts)
+        for chunk in chunks:
+            write_items(
+                chunk.where(query),
+                stream or args.stream, indent=args.indent,
+            )
         return 0
 
 
@@ -664,9 +824,17 @@ class HostsHeadCommand(SubCommand):
     def add_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("-n", type=int, help="number of hosts", default=10)
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(Hosts.from_json(input()).head(args.n).to_json(indent=args.indent))
+        chunks, stream = read_items(Hosts)
+        if stream and args.n >= 0:
+            # Each chunk holds a single item, stop reading after 'n' of them
+            for chunk in islice(chunks, args.n):
+                write_items(chunk, stream)
+            return 0
+
+        write_items(join_items(Hosts, chunks).head(args.n), stream or args.stream, indent=args.indent)
         return 0
 
 
@@ -678,9 +846,11 @@ class HostsTailCommand(SubCommand):
     def add_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("-n", type=int, help="number of hosts", default=10)
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(Hosts.from_json(input()).tail(args.n).to_json(indent=args.indent))
+        items, stream = collect_items(Hosts)
+        write_items(items.tail(args.n), stream or args.stream, indent=args.indent)
         return 0
 
 
@@ -691,9 +861,12 @@ class HostsResultsCommand(SubCommand):
 
     def add_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(Hosts.from_json(input()).results().to_json(indent=args.indent))
+        chunks, stream = read_items(Hosts)
+        for chunk in chunks:
+            write_items(chunk.results(), stream or args.stream, indent=args.indent)
         return 0
 
 
@@ -705,9 +878,10 @@ class RunnersFromFileCommand(SubCommand):
     def add_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("filepath")
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(Runners.from_file(args.filepath).to_json(indent=args.indent))
+        write_items(Runners.from_file(args.filepath), args.stream, indent=args.indent)
         return 0
 
 
@@ -719,13 +893,11 @@ class RunnersToFileCommand(SubCommand):
     def add_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("filepath")
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(
-            Runners.from_json(input())
-            .to_file(args.filepath)
-            .to_json(indent=args.indent)
-        )
+        items, stream = collect_items(Runners)
+        write_items(items.to_file(args.filepath), stream or args.stream, indent=args.indent)
         return 0
 
 
@@ -740,13 +912,12 @@ class RunnersFilterCommand(SubCommand):
             "args", nargs="*", help="arguments to be passed to the filter"
         )
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(
-            Runners.from_json(input())
-            .filter(args.filter, *args.args)
-            .to_json(indent=args.indent)
-        )
+        chunks, stream = read_items(Runners)
+        for chunk in chunks:
+            write_items(chunk.filter(args.filter, *args.args), stream or args.stream, indent=args.indent)
         return 0
 
 
@@ -759,7 +930,8 @@ class RunnersCountCommand(SubCommand):
         pass
 
     def __call__(self, args: Namespace) -> int:
-        print(Runners.from_json(input()).count())
+        chunks, _ = read_items(Runners)
+        print(sum(c.count() for c in chunks))
         return 0
 
 
@@ -776,12 +948,12 @@ class RunnersOrderByCommand(SubCommand):
             "--reverse", action="store_true", help="reverse the order after sort"
         )
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(
-            Runners.from_json(input())
-            .order_by(*args.properties, reverse=args.reverse)
-            .to_json(indent=args.indent)
+        items, stream = collect_items(Runners)
+        write_items(
+            items.order_by(*args.properties, reverse=args.reverse), stream or args.stream, indent=args.indent,
         )
         return 0
 
@@ -797,13 +969,11 @@ class RunnersSortCommand(SubCommand):
             "--reverse", action="store_true", help="reverse the order after sort"
         )
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(
-            Runners.from_json(input())
-            .sort(key=args.key, reverse=args.reverse)
-            .to_json(indent=args.indent)
-        )
+        items, stream = collect_items(Runners)
+        write_items(items.sort(key=args.key, reverse=args.reverse), stream or args.stream, indent=args.indent)
         return 0
 
 
@@ -818,13 +988,19 @@ class RunnersPipeCommand(SubCommand):
             "args", nargs="*", help="arguments to be passed to the filter"
         )
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        obj: t.Any = Runners.from_json(input()).pipe(args.handler, *args.args)
+        items, stream = collect_items(Runners)
+        obj: t.Any = items.pipe(args.handler, *args.args)
 
         if obj is None:
             return 0
 
+        if isinstance(obj, ViperItems):
+            write_items(obj, stream or args.stream, indent=args.indent)
+            return 0
+
         if isinstance(obj, ViperCollection):
             print(obj.to_json(indent=args.indent))
             return 0
@@ -845,7 +1021,10 @@ class RunnersFormatCommand(SubCommand):
         )
 
     def __call__(self, args: Namespace) -> int:
-        print(Runners.from_json(input()).format(args.template, sep=args.sep))
+        chunks, stream = read_items(Runners)
+        for chunk in chunks:
+            # While streaming, each item is printed on its own line
+            print(chunk.format(args.template, sep=args.sep), flush=stream)
         return 0
 
 
@@ -860,14 +1039,20 @@ class RunnersWhereCommand(SubCommand):
             "condition", choices=[o.value for o in WhereConditions],
         )
         parser.add_argument("values", nargs="*")
+        add_where_clause_arguments(parser)
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(
-            Runners.from_json(input())
-            .where(args.key, WhereConditions(args.condition), args.values)
-            .to_json(indent=args.indent)
+        query = where_query(
+            args.clauses, Where(args.key, WhereConditions(args.condition), args.values)
         )
+        chunks, stream = read_items(Runners)
+        for chunk in chunks:
+            write_items(
+                chunk.where(query),
+                stream or args.stream, indent=args.indent,
+            )
         return 0
 
 
@@ -879,9 +1064,17 @@ class RunnersHeadCommand(SubCommand):
     def add_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("-n", type=int, help="number of hosts", default=10)
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(Runners.from_json(input()).head(args.n).to_json(indent=args.indent))
+        chunks, stream = read_items(Runners)
+        if stream and args.n >= 0:
+            # Each chunk holds a single item, stop reading after 'n' of them
+            for chunk in islice(chunks, args.n):
+                write_items(chunk, stream)
+            return 0
+
+        write_items(join_items(Runners, chunks).head(args.n), stream or args.stream, indent=args.indent)
         return 0
 
 
@@ -893,9 +1086,11 @@ class RunnersTailCommand(SubCommand):
     def add_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("-n", type=int, help="number of hosts", default=10)
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(Runners.from_json(input()).tail(args.n).to_json(indent=args.indent))
+        items, stream = collect_items(Runners)
+        write_items(items.tail(args.n), stream or args.stream, indent=args.indent)
         return 0
 
 
@@ -906,14 +1101,33 @@ class RunnersRunCommand(SubCommand):
 
     def add_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("--max-workers", type=int, default=Config.max_workers.value)
+        parser.add_argument(
+            "--engine",
+            choices=[e.value for e in Engines],
+            default=Engines.thread.value,
+            help="the execution engine to use",
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=1,
+            help="number of worker processes to shard the runners across",
+        )
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(
-            Runners.from_json(input())
-            .run(max_workers=args.max_workers)
-            .to_json(indent=args.indent)
+        runners, stream = collect_items(Runners)
+        results = runners.iter_run(
+            max_workers=args.max_workers,
+            engine=Engines(args.engine),
+            processes=args.processes,
         )
+        if stream or args.stream:
+            for result in results:
+                print(result.to_json(), flush=True)
+        else:
+            print(Results.from_items(results).to_json(indent=args.indent))
         return 0
 
 
@@ -924,9 +1138,15 @@ class RunnersHostsCommand(SubCommand):
 
     def add_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(Runners.from_json(input()).hosts().to_json(indent=args.indent))
+        chunks, stream = read_items(Runners)
+        seen: t.Set[Host] = set()
+        for chunk in chunks:
+            hosts = Hosts.from_items(h for h in chunk.hosts().all() if h not in seen)
+            seen.update(hosts.all())
+            write_items(hosts, stream or args.stream, indent=args.indent)
         return 0
 
 
@@ -942,10 +1162,41 @@ class ResultsFromHistoryCommand(SubCommand):
             action="store_true",
             help="get the final results only (shortcut to `viper results | viper results:final`)",
         )
+        parser.add_argument("--limit", type=int, help="fetch at most 'n' results")
+        parser.add_argument("--offset", type=int, help="skip the first 'n' results")
+        parser.add_argument(
+            "--since",
+            type=float,
+            help="fetch the results triggered at or after this time",
+        )
+        parser.add_argument(
+            "--until", type=float, help="fetch the results triggered before this time",
+        )
+        add_where_clause_arguments(parser, where=True)
+        parser.add_argument(
+            "--order-by", nargs="+", default=[], help="sort the results by properties"
+        )
+        parser.add_argument(
+            "--reverse", action="store_true", help="reverse the order after sort"
+        )
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(Results.from_history(final=args.final).to_json(indent=args.indent))
+        write_items(
+            Results.from_history(
+                final=args.final,
+                where=where_query(args.clauses),
+                order_by=args.order_by,
+                reverse=args.reverse,
+                limit=args.limit,
+                offset=args.offset,
+                since=args.since,
+                until=args.until,
+            ),
+            args.stream,
+            indent=args.indent,
+        )
         return 0
 
 
@@ -957,9 +1208,10 @@ class ResultsFromFileCommand(SubCommand):
     def add_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("filepath")
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(Results.from_file(args.filepath).to_json(indent=args.indent))
+        write_items(Results.from_file(args.filepath), args.stream, indent=args.indent)
         return 0
 
 
@@ -971,13 +1223,11 @@ class ResultsToFileCommand(SubCommand):
     def add_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("filepath")
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(
-            Results.from_json(input())
-            .to_file(args.filepath)
-            .to_json(indent=args.indent)
-        )
+        items, stream = collect_items(Results)
+        write_items(items.to_file(args.filepath), stream or args.stream, indent=args.indent)
         return 0
 
 
@@ -992,13 +1242,12 @@ class ResultsFilterCommand(SubCommand):
             "args", nargs="*", help="arguments to be passed to the filter"
         )
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(
-            Results.from_json(input())
-            .filter(args.filter, *args.args)
-            .to_json(indent=args.indent)
-        )
+        chunks, stream = read_items(Results)
+        for chunk in chunks:
+            write_items(chunk.filter(args.filter, *args.args), stream or args.stream, indent=args.indent)
         return 0
 
 
@@ -1011,7 +1260,8 @@ class ResultsCountCommand(SubCommand):
         pass
 
     def __call__(self, args: Namespace) -> int:
-        print(Results.from_json(input()).count())
+        chunks, _ = read_items(Results)
+        print(sum(c.count() for c in chunks))
         return 0
 
 
@@ -1028,12 +1278,12 @@ class ResultsOrderByCommand(SubCommand):
             "--reverse", action="store_true", help="reverse the order after sort"
         )
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(
-            Results.from_json(input())
-            .order_by(*args.properties, reverse=args.reverse)
-            .to_json(indent=args.indent)
+        items, stream = collect_items(Results)
+        write_items(
+            items.order_by(*args.properties, reverse=args.reverse), stream or args.stream, indent=args.indent,
         )
         return 0
 
@@ -1049,13 +1299,11 @@ class ResultsSortCommand(SubCommand):
             "--reverse", action="store_true", help="reverse the order after sort"
         )
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(
-            Results.from_json(input())
-            .sort(key=args.key, reverse=args.reverse)
-            .to_json(indent=args.indent)
-        )
+        items, stream = collect_items(Results)
+        write_items(items.sort(key=args.key, reverse=args.reverse), stream or args.stream, indent=args.indent)
         return 0
 
 
@@ -1070,13 +1318,19 @@ class ResultsPipeCommand(SubCommand):
             "args", nargs="*", help="arguments to be passed to the filter"
         )
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        obj: t.Any = Results.from_json(input()).pipe(args.handler, *args.args)
+        items, stream = collect_items(Results)
+        obj: t.Any = items.pipe(args.handler, *args.args)
 
         if obj is None:
             return 0
 
+        if isinstance(obj, ViperItems):
+            write_items(obj, stream or args.stream, indent=args.indent)
+            return 0
+
         if isinstance(obj, ViperCollection):
             print(obj.to_json(indent=args.indent))
             return 0
@@ -1097,7 +1351,10 @@ class ResultsFormatCommand(SubCommand):
         )
 
     def __call__(self, args: Namespace) -> int:
-        print(Results.from_json(input()).format(args.template, sep=args.sep))
+        chunks, stream = read_items(Results)
+        for chunk in chunks:
+            # While streaming, each item is printed on its own line
+            print(chunk.format(args.template, sep=args.sep), flush=stream)
         return 0
 
 
@@ -1114,14 +1371,20 @@ class ResultsWhereCommand(SubCommand):
             help="condition to apply",
         )
         parser.add_argument("values", nargs="*", help="values for the key")
+        add_where_clause_arguments(parser)
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(
-            Results.from_json(input())
-            .where(args.key, WhereConditions(args.condition), args.values)
-            .to_json(indent=args.indent)
+        query = where_query(
+            args.clauses, Where(args.key, WhereConditions(args.condition), args.values)
         )
+        chunks, stream = read_items(Results)
+        for chunk in chunks:
+            write_items(
+                chunk.where(query),
+                stream or args.stream, indent=args.indent,
+            )
         return 0
 
 
@@ -1133,9 +1396,17 @@ class ResultsHeadCommand(SubCommand):
     def add_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("-n", type=int, help="number of hosts", default=10)
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(Results.from_json(input()).head(args.n).to_json(indent=args.indent))
+        chunks, stream = read_items(Results)
+        if stream and args.n >= 0:
+            # Each chunk holds a single item, stop reading after 'n' of them
+            for chunk in islice(chunks, args.n):
+                write_items(chunk, stream)
+            return 0
+
+        write_items(join_items(Results, chunks).head(args.n), stream or args.stream, indent=args.indent)
         return 0
 
 
@@ -1147,9 +1418,11 @@ class ResultsTailCommand(SubCommand):
     def add_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("-n", type=int, help="number of hosts", default=10)
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(Results.from_json(input()).tail(args.n).to_json(indent=args.indent))
+        items, stream = collect_items(Results)
+        write_items(items.tail(args.n), stream or args.stream, indent=args.indent)
         return 0
 
 
@@ -1160,9 +1433,15 @@ class ResultsHostsCommand(SubCommand):
 
     def add_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(Results.from_json(input()).hosts().to_json(indent=args.indent))
+        chunks, stream = read_items(Results)
+        seen: t.Set[Host] = set()
+        for chunk in chunks:
+            hosts = Hosts.from_items(h for h in chunk.hosts().all() if h not in seen)
+            seen.update(hosts.all())
+            write_items(hosts, stream or args.stream, indent=args.indent)
         return 0
 
 
@@ -1173,9 +1452,12 @@ class ResultsRunnersCommand(SubCommand):
 
     def add_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(Results.from_json(input()).runners().to_json(indent=args.indent))
+        chunks, stream = read_items(Results)
+        for chunk in chunks:
+            write_items(chunk.runners(), stream or args.stream, indent=args.indent)
         return 0
 
 
@@ -1186,15 +1468,33 @@ class ResultsReRunCommand(SubCommand):
 
     def add_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("--max-workers", type=int, default=Config.max_workers.value)
+        parser.add_argument(
+            "--engine",
+            choices=[e.value for e in Engines],
+            default=Engines.thread.value,
+            help="the execution engine to use",
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=1,
+            help="number of worker processes to shard the runners across",
+        )
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(
-            Results.from_json(input())
-            .runners()
-            .run(max_workers=args.max_workers)
-            .to_json(indent=args.indent)
+        items, stream = collect_items(Results)
+        results = items.runners().iter_run(
+            max_workers=args.max_workers,
+            engine=Engines(args.engine),
+            processes=args.processes,
         )
+        if stream or args.stream:
+            for result in results:
+                print(result.to_json(), flush=True)
+        else:
+            print(Results.from_items(results).to_json(indent=args.indent))
         return 0
 
 
@@ -1205,9 +1505,12 @@ class ResultsByTaskCommand(SubCommand):
 
     def add_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(Results.by_task(Task.from_json(input())).to_json(indent=args.indent))
+        write_items(
+            Results.by_task(Task.from_json(input())), args.stream, indent=args.indent
+        )
         return 0
 
 
@@ -1218,9 +1521,11 @@ class ResultsFinal(SubCommand):
 
     def add_arguments(self, parser: ArgumentParser) -> None:
         parser.add_argument("-i", "--indent", type=int, default=None)
+        add_stream_argument(parser)
 
     def __call__(self, args: Namespace) -> int:
-        print(Results.from_json(input()).final().to_json(indent=args.indent))
+        items, stream = collect_items(Results)
+        write_items(items.final(), stream or args.stream, indent=args.indent)
         return 0
 
 
@@ -1242,6 +1547,9 @@ def run() -> int:
     # Init command
     InitCommand.attach_to(subparsers)
 
+    # DB commands
+    DBMigrateCommand.attach_to(subparsers)
+
     # Init command
     LetsCommand.attach_to(subparsers)
 
@@ -1342,6 +1650,11 @@ def run() -> int:
 
     try:
         return int(args._handler(args))
+    except BrokenPipeError:
+        # The next stage stopped reading (e.g. ``results:head``), so don't
+        # let the interpreter complain while flushing the standard output.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
     except Exception as e:
         print(f"error: {e}", file=sys.stderr)
         if args.debug:
@@ -3,10 +3,21 @@
 from argparse import _SubParsersAction
 from argparse import ArgumentParser
 from argparse import Namespace
+from itertools import chain
+from viper.collections import ItemsType
+from viper.const import Config
 
+import sys
 import typing as t
 
-__all__ = ["SubCommand"]
+__all__ = [
+    "SubCommand",
+    "add_stream_argument",
+    "read_items",
+    "join_items",
+    "collect_items",
+    "write_items",
+]
 
 
 class SubCommand:
@@ -42,3 +53,80 @@ class SubCommand:
 
     def __call__(self, args: Namespace) -> int:
         raise NotImplementedError()  # no cover
+
+
+def add_stream_argument(parser: ArgumentParser) -> None:
+    """Add the ``--stream`` option to the subcommand parser.
+
+    It defaults to true if the ``VIPER_STREAM`` environment variable is set to 1.
+    """
+
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        default=Config.stream.value == "1",
+        help="write one item per line (NDJSON) as soon as it is available",
+    )
+
+
+def read_items(
+    items_type: t.Type[ItemsType],
+) -> t.Tuple[t.Iterator[ItemsType], bool]:
+    """Read the items from the standard input.
+
+    The input can either be the JSON representation of the whole collection,
+    or a stream of items in NDJSON format (one JSON object per line) as
+    written by the ``--stream`` option.
+
+    :returns: The chunks of items and whether the input is being streamed.
+        For a stream, each chunk holds a single item.
+    """
+
+    first = sys.stdin.readline()
+    if not first.lstrip().startswith("{"):
+        return iter([items_type.from_json(first + sys.stdin.read())]), False
+
+    def stream() -> t.Iterator[ItemsType]:
+        for line in chain([first], sys.stdin):
+            if line.strip():
+                yield items_type.from_items(items_type._item_type.from_json(line))
+
+    return stream(), True
+
+
+def join_items(
+    items_type: t.Type[ItemsType], chunks: t.Iterable[ItemsType]
+) -> ItemsType:
+    """Join the chunks of items into one collection."""
+
+    return items_type.from_items(i for c in chunks for i in c.all())
+
+
+def collect_items(items_type: t.Type[ItemsType]) -> t.Tuple[ItemsType, bool]:
+    """Read all the items from the standard input into one collection.
+
+    This is used by the stages that need all the items at once, e.g. for sorting.
+    See :py:func:`read_items`.
+
+    :returns: The items and whether the input was streamed.
+    """
+
+    chunks, stream = read_items(items_type)
+    return join_items(items_type, chunks), stream
+
+
+def write_items(items: t.Any, stream: bool, indent: t.Optional[int] = None) -> None:
+    """Write the items to the standard output.
+
+    :param viper.collections.Items items: The items to write.
+    :param bool stream: If True, write one item per line in NDJSON format and
+        flush each line. Else write the whole collection as JSON.
+    :param int indent: The JSON indentation (not used while streaming).
+    """
+
+    if not stream:
+        print(items.to_json(indent=indent))
+        return
+
+    for item in items.all():
+        print(item.to_json(), flush=True)
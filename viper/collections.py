@@ -319,20 +319,34 @@ Apart from these, a :py:class:`~viper.Task` also optionally expects ``timeout``,
 """
 
 from __future__ import annotations
+from _string import formatter_field_name_split
 from collections import namedtuple
 from collections import OrderedDict
 from collections.abc import Iterable
 from concurrent.futures import as_completed
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
 from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from dataclasses import dataclass
 from dataclasses import field
 from enum import Enum
+from functools import lru_cache
+from itertools import islice
 from json import dumps as dumpjson
 from json import loads as loadjson
 from pydoc import locate
+from queue import Queue
+from string import Formatter
+from threading import Thread
 from time import time
 from types import FunctionType
 from viper.const import Config
+from viper.db import insert_results
+from viper.db import ResultSink
+from viper.db import RowType
+from viper.db import select_results
 from viper.db import ViperDB
 from viper.serializers import Serializers
 from viper.utils import flatten_dict
@@ -340,13 +354,20 @@ from viper.utils import optional
 from viper.utils import required
 from viper.utils import unflatten_dict
 
+import asyncio
+import operator
 import subprocess
 import sys
 import traceback
 import typing as t
 
 __all__ = [
+    "Engines",
     "WhereConditions",
+    "Query",
+    "Where",
+    "AllOf",
+    "AnyOf",
     "Collection",
     "meta",
     "Item",
@@ -369,6 +390,20 @@ ItemsType = t.TypeVar("ItemsType", bound="Items[t.Any]")
 JSONValueType = t.Optional[t.Union[str, bool, int, float]]
 
 
+class Engines(Enum):
+    """Execution engines for running the tasks.
+
+    :example:
+
+    .. code-block:: python
+
+        hosts.task(task).run(max_workers=500, engine=Engines.asyncio)
+    """
+
+    thread = "thread"
+    asyncio = "asyncio"
+
+
 class WhereConditions(Enum):
     """Where query conditions for viper Items.
 
@@ -390,6 +425,431 @@ class WhereConditions(Enum):
     not_startswith = "NOT_STARTSWITH"
     endswith = "ENDSWITH"
     not_endswith = "NOT_ENDSWITH"
+    gt = "GT"
+    ge = "GE"
+    lt = "LT"
+    le = "LE"
+    between = "BETWEEN"
+
+
+_NUMERIC_OPERATORS = {
+    WhereConditions.gt: operator.gt,
+    WhereConditions.ge: operator.ge,
+    WhereConditions.lt: operator.lt,
+    WhereConditions.le: operator.le,
+}
+
+
+@lru_cache(maxsize=None)
+def _compile_key(
+    key: str,
+) -> t.Tuple[t.Callable[[t.Any], object], t.Callable[[object], str]]:
+    """Compile the ``"{key}".format(...)`` lookup into a getter and a formatter."""
+
+    parsed = list(Formatter().parse(f"{{{key}}}"))
+    if len(parsed) != 1 or parsed[0][0] or parsed[0][1] is None:
+        raise ValueError(f"{key}: invalid key")
+
+    _, name, spec, conversion = parsed[0]
+    first, rest = formatter_field_name_split(name)
+    path = tuple(rest)
+    convert = {"r": repr, "s": str, "a": ascii}.get(conversion or "")
+
+    def get(obj: t.Any) -> object:
+        try:
+            value = getattr(obj, first)
+        except AttributeError:
+            raise KeyError(first)
+        for is_attr, part in path:
+            value = getattr(value, part) if is_attr else value[part]
+        return value
+
+    if not convert and not spec:
+        # format(value, "") is the same as str(value)
+        return get, str
+
+    def text(value: object) -> str:
+        if convert:
+            value = convert(value)
+        return format(value, spec or "")
+
+    return get, text
+
+
+@dataclass(frozen=True)
+class Query:
+    """The base class for the where queries.
+
+    Queries can be combined using ``&`` (and) and ``|`` (or).
+
+    :example:
+
+    .. code-block:: python
+
+        results.where(
+            Where("returncode", WhereConditions.gt, ["0"])
+            & (
+                Where("host.meta.dc", WhereConditions.is_, ["dc1"])
+                | Where("retry", WhereConditions.ge, ["2"])
+            )
+        )
+    """
+
+    def __and__(self, other: Query) -> AllOf:
+        return AllOf(self._parts(AllOf) + other._parts(AllOf))
+
+    def __or__(self, other: Query) -> AnyOf:
+        return AnyOf(self._parts(AnyOf) + other._parts(AnyOf))
+
+    def _parts(self, kind: type) -> t.Tuple[Query, ...]:
+        if isinstance(self, (AllOf, AnyOf)) and isinstance(self, kind):
+            return self.queries
+        return (self,)
+
+    def predicate(self) -> t.Callable[[t.Any], bool]:
+        """Get the compiled predicate that tests an item against the query.
+
+        The predicates are cached, so the same query is compiled only once.
+
+        :rtype: callable
+        """
+        return _compile_query(self)
+
+    def _compile(self) -> t.Callable[[t.Any], bool]:  # pragma: no cover
+        raise NotImplementedError()
+
+
+@dataclass(frozen=True)
+class Where(Query):
+    """Select the items where the value of the given key matches the condition.
+
+    :param str key: The key will be compiled by Python's `.format()`.
+    :param viper.collections.WhereConditions condition: The where condition.
+    :param list values: The values for the key. ``GT``, ``GE``, ``LT`` and ``LE``
+        expect one value and ``BETWEEN`` expects two (inclusive) values, which
+        are compared as numbers.
+
+    :example:
+
+    .. code-block:: python
+
+        Where("host.ip", WhereConditions.is_, ["1.1.1.1", "2.2.2.2"])
+    """
+
+    key: str
+    condition: WhereConditions
+    values: t.Sequence[str] = ()
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.condition, WhereConditions):
+            raise ValueError(f"expecting enum {WhereConditions}")
+
+        values = self.values
+        if isinstance(values, str):
+            values = (values,)
+        object.__setattr__(self, "values", tuple(values))
+
+        expected = {WhereConditions.between: 2, **{c: 1 for c in _NUMERIC_OPERATORS}}
+        count = expected.get(self.condition)
+        if count is not None and len(self.values) != count:
+            raise ValueError(
+                f"{self.condition.value}: expecting {count} value(s) but got {len(self.values)}"
+            )
+
+    def _compile(self) -> t.Callable[[t.Any], bool]:
+        get, text = _compile_key(self.key)
+        cond, values = self.condition, self.values
+
+        if cond is WhereConditions.is_:
+            options = frozenset(values)
+            return lambda obj: text(get(obj)) in options
+
+        if cond is WhereConditions.is_not:
+            options = frozenset(values)
+            return lambda obj: text(get(obj)) not in options
+
+        if cond is WhereConditions.contains:
+            return lambda obj: any(v in text(get(obj)) for v in values)
+
+        if cond is WhereConditions.not_contains:
+            return lambda obj: not all(v in text(get(obj)) for v in values)
+
+        if cond is WhereConditions.startswith:
+            return lambda obj: text(get(obj)).startswith(values)
+
+        if cond is WhereConditions.not_startswith:
+            return lambda obj: not all(map(text(get(obj)).startswith, values))
+
+        if cond is WhereConditions.endswith:
+            return lambda obj: text(get(obj)).endswith(values)
+
+        if cond is WhereConditions.not_endswith:
+            return lambda obj: not all(map(text(get(obj)).endswith, values))
+
+        try:
+            bounds = tuple(float(v) for v in values)
+        except ValueError:
+            raise ValueError(f"{cond.value}: expecting numbers but got {values}")
+
+        def number(obj: t.Any) -> t.Optional[float]:
+            value = get(obj)
+            if isinstance(value, (int, float)):
+                return float(value)
+            try:
+                return float(text(value))
+            except ValueError:
+                return None
+
+        if cond is WhereConditions.between:
+            low, high = bounds
+
+            def between(obj: t.Any) -> bool:
+                num = number(obj)
+                return num is not None and low <= num <= high
+
+            return between
+
+        op, bound = _NUMERIC_OPERATORS[cond], bounds[0]
+
+        def compare(obj: t.Any) -> bool:
+            num = number(obj)
+            return num is not None and op(num, bound)
+
+        return compare
+
+
+@dataclass(frozen=True)
+class AllOf(Query):
+    """Select the items matching all the queries (``query1 & query2``)."""
+
+    queries: t.Tuple[Query, ...]
+
+    def _compile(self) -> t.Callable[[t.Any], bool]:
+        predicates = tuple(q.predicate() for q in self.queries)
+        return lambda obj: all(p(obj) for p in predicates)
+
+
+@dataclass(frozen=True)
+class AnyOf(Query):
+    """Select the items matching any of the queries (``query1 | query2``)."""
+
+    queries: t.Tuple[Query, ...]
+
+    def _compile(self) -> t.Callable[[t.Any], bool]:
+        predicates = tuple(q.predicate() for q in self.queries)
+        return lambda obj: any(p(obj) for p in predicates)
+
+
+@lru_cache(maxsize=1024)
+def _compile_query(query: Query) -> t.Callable[[t.Any], bool]:
+    return query._compile()
+
+
+# The result fields that map to the columns of the results table, and how their
+# values look like in SQL: "int" and "real" are numbers, "text" is a non-null
+# string and "nullable" is an optional string.
+_RESULT_COLUMNS = {
+    "trigger_time": ("trigger_time", "real"),
+    "returncode": ("returncode", "int"),
+    "start": ("start", "real"),
+    "end": ("end", "real"),
+    "retry": ("retry", "int"),
+    "stdout": ("stdout", "text"),
+    "stderr": ("stderr", "text"),
+    "host.ip": ("host_ip", "text"),
+    "host.hostname": ("host_hostname", "nullable"),
+    "task.name": ("task_name", "text"),
+}
+
+# The JSON documents of the nested result fields
+_RESULT_DOCUMENTS = {
+    "host": "COALESCE(host, hosts.data)",
+    "task": "COALESCE(task, tasks.data)",
+}
+
+SQLType = t.Tuple[str, t.List[object], bool]
+
+
+def _result_field_sql(key: str) -> t.Optional[t.Tuple[str, str, t.List[object]]]:
+    """Get the SQL expression, kind and parameters for the given result key.
+
+    Returns None if the key cannot be looked up in SQL.
+    """
+
+    parsed = list(Formatter().parse(f"{{{key}}}"))
+    if len(parsed) != 1 or parsed[0][0] or parsed[0][2] or parsed[0][3]:
+        return None
+
+    name = t.cast(str, parsed[0][1])
+    first, rest = formatter_field_name_split(name)
+    path = tuple(part for _, part in rest)
+    normalized = ".".join((str(first),) + tuple(map(str, path)))
+
+    if normalized in _RESULT_COLUMNS:
+        column, kind = _RESULT_COLUMNS[normalized]
+        return column, kind, []
+
+    if first in _RESULT_DOCUMENTS and path:
+        jsonpath = "$" + "".join('."{}"'.format(str(p).replace('"', "")) for p in path)
+        return _RESULT_DOCUMENTS[t.cast(str, first)], "json", [jsonpath]
+
+    return None
+
+
+def _where_sql(query: Query) -> t.Optional[SQLType]:
+    """Translate the where query into a SQL condition over the results table.
+
+    The condition selects a superset of the matching results. It selects the
+    exact set if the returned flag is true, else the selected results need to be
+    filtered again using the query. Returns None if nothing could be translated.
+    """
+
+    if isinstance(query, AllOf):
+        parts = [_where_sql(q) for q in query.queries]
+        translated = [p for p in parts if p is not None]
+        if not translated:
+            return None
+        return (
+            " AND ".join(f"({p[0]})" for p in translated),
+            [v for p in translated for v in p[1]],
+            len(translated) == len(parts) and all(p[2] for p in translated),
+        )
+
+    if isinstance(query, AnyOf):
+        parts = [_where_sql(q) for q in query.queries]
+        if None in parts:
+            return None
+        return (
+            " OR ".join(f"({p[0]})" for p in t.cast(t.List[SQLType], parts)),
+            [v for p in t.cast(t.List[SQLType], parts) for v in p[1]],
+            all(t.cast(SQLType, p)[2] for p in parts),
+        )
+
+    if not isinstance(query, Where):  # pragma: no cover
+        return None
+
+    field_sql = _result_field_sql(query.key)
+    if field_sql is None:
+        return None
+
+    expr, kind, params = field_sql
+    cond, values = query.condition, list(query.values)
+
+    if cond is WhereConditions.between or cond in _NUMERIC_OPERATORS:
+        if kind in ("text", "nullable"):
+            return None
+
+        bounds: t.List[object] = [float(v) for v in values]
+        if cond is WhereConditions.between:
+            template = "{} BETWEEN ? AND ?"
+        else:
+            op = {"GT": ">", "GE": ">=", "LT": "<", "LE": "<="}[cond.value]
+            template = "{} " + op + " ?"
+
+        if kind != "json":
+            return template.format(expr), bounds, True
+
+        # JSON strings may still be parsed as numbers in Python
+        num = (
+            f"CASE JSON_TYPE({expr}, ?)"
+            f" WHEN 'integer' THEN JSON_EXTRACT({expr}, ?)"
+            f" WHEN 'real' THEN JSON_EXTRACT({expr}, ?)"
+            " WHEN 'true' THEN 1 WHEN 'false' THEN 0 END"
+        )
+        return (
+            f"JSON_TYPE({expr}, ?) = 'text' OR ({template.format(num)})",
+            params * 4 + bounds,
+            False,
+        )
+
+    if kind == "real":
+        # Python's representation of floats can't be reproduced in SQL
+        return None
+
+    exact = True
+    if kind == "int":
+        text = f"CAST({expr} AS TEXT)"
+    elif kind == "nullable":
+        text = f"COALESCE({expr}, 'None')"
+    elif kind == "json":
+        # Floats, objects and arrays are left to Python
+        text = (
+            f"CASE JSON_TYPE({expr}, ?)"
+            f" WHEN 'text' THEN JSON_EXTRACT({expr}, ?)"
+            f" WHEN 'integer' THEN CAST(JSON_EXTRACT({expr}, ?) AS TEXT)"
+            " WHEN 'true' THEN 'True' WHEN 'false' THEN 'False'"
+            " WHEN 'null' THEN 'None' END"
+        )
+        params = params * 3
+        exact = False
+    else:
+        text = expr
+
+    if cond is WhereConditions.is_ or cond is WhereConditions.is_not:
+        op = "NOT IN" if cond is WhereConditions.is_not else "IN"
+        sql = f"{text} {op} ({', '.join('?' for _ in values)})"
+        sql_params = params + t.cast(t.List[object], values)
+    else:
+        if cond in (WhereConditions.contains, WhereConditions.not_contains):
+            template, repeat = f"INSTR({text}, ?) > 0", 1
+        elif cond in (WhereConditions.startswith, WhereConditions.not_startswith):
+            template, repeat = f"SUBSTR({text}, 1, LENGTH(?)) = ?", 2
+        else:
+            template, repeat = f"SUBSTR({text}, -LENGTH(?)) = ?", 2
+
+        clauses: t.List[str] = []
+        sql_params: t.List[object] = []
+        for value in values:
+            if not value:
+                # Every string contains, starts and ends with ""
+                clauses.append("1")
+                continue
+            clauses.append(template)
+            sql_params += params + [value] * repeat
+
+        if cond in (
+            WhereConditions.not_contains,
+            WhereConditions.not_startswith,
+            WhereConditions.not_endswith,
+        ):
+            sql = f"NOT ({' AND '.join(clauses)})" if clauses else "0"
+        else:
+            sql = " OR ".join(clauses) or "0"
+
+    if not exact:
+        # The unknown values are left to Python
+        return f"{text} IS NULL OR ({sql})", params + sql_params, False
+
+    return sql, sql_params, True
+
+
+def _order_by_sql(properties: t.Sequence[str], reverse: bool) -> t.Optional[str]:
+    """Translate the order by properties into a SQL ``ORDER BY`` clause.
+
+    The values are compared the same way as :py:meth:`Items.order_by` does.
+    Returns None if any of the properties cannot be translated.
+    """
+
+    order = "DESC" if reverse else "ASC"
+    parts = []
+    for prop in properties:
+        field_sql = _result_field_sql(prop)
+        if field_sql is None:
+            return None
+
+        expr, kind, _ = field_sql
+        if kind == "int":
+            parts.append(f"CAST({expr} AS TEXT) {order}")
+        elif kind == "nullable":
+            parts.append(f"COALESCE({expr}, 'None') {order}")
+        elif kind == "text":
+            parts.append(f"{expr} {order}")
+        else:
+            return None
+
+    # Same as the stable sort over the results ordered by the start time
+    parts.append("start DESC")
+    return ", ".join(parts)
 
 
 def meta(**mapping: JSONValueType) -> t.Any:
@@ -895,11 +1355,15 @@ class Items(Collection, t.Generic[T]):
         return sep.join(x.format(template) for x in self._all)
 
     def where(
-        self: ItemsType, key: str, condition: WhereConditions, values: t.Sequence[str]
+        self: ItemsType,
+        key: t.Union[str, Query],
+        condition: t.Optional[WhereConditions] = None,
+        values: t.Sequence[str] = (),
     ) -> ItemsType:
         """Select items by a custom query.
 
         :param str key: The key will be compiled by Python's `.format()`.
+            Or a :py:class:`viper.collections.Query` to combine multiple conditions.
         :param viper.collections.WhereConditions condition: The where condition.
         :param list values: The values for the key.
         :rtype: Items
@@ -911,48 +1375,18 @@ class Items(Collection, t.Generic[T]):
                 Host("1.1.1.1"),
                 Host("2.2.2.2")
             ).where("ip", WhereConditions.is_, ["1.1.1.1"])
-        """
-        result = []
-
-        for obj in self._all:
-            val = obj.format(f"{{{key}}}")
-
-            if condition is WhereConditions.is_:
-                if val in values:
-                    result.append(obj)
-
-            elif condition is WhereConditions.is_not:
-                if val not in values:
-                    result.append(obj)
-
-            elif condition is WhereConditions.contains:
-                if any(map(lambda x: x in val, values)):
-                    result.append(obj)
 
-            elif condition is WhereConditions.not_contains:
-                if any(map(lambda x: x not in val, values)):
-                    result.append(obj)
-
-            elif condition is WhereConditions.startswith:
-                if any(map(lambda x: val.startswith(x), values)):
-                    result.append(obj)
-
-            elif condition is WhereConditions.not_startswith:
-                if any(map(lambda x: not val.startswith(x), values)):
-                    result.append(obj)
-
-            elif condition is WhereConditions.endswith:
-                if any(map(lambda x: val.endswith(x), values)):
-                    result.append(obj)
-
-            elif condition is WhereConditions.not_endswith:
-                if any(map(lambda x: not val.endswith(x), values)):
-                    result.append(obj)
-
-            else:
-                raise ValueError(f"expecting enum {WhereConditions}")
+            results.where(
+                Where("returncode", WhereConditions.gt, ["0"])
+                | Where("retry", WhereConditions.ge, ["1"])
+            )
+        """
+        if isinstance(key, Query):
+            query = key
+        else:
+            query = Where(key, t.cast(WhereConditions, condition), values)
 
-        return type(self).from_items(*result)
+        return type(self)(tuple(filter(query.predicate(), self._all)))
 
 
 @dataclass(frozen=True, order=True)
@@ -1089,15 +1523,22 @@ class Hosts(Items[Host]):
         )
 
     def run_task(
-        self, task: Task, *args: str, max_workers: int = Config.max_workers.value
+        self,
+        task: Task,
+        *args: str,
+        max_workers: int = Config.max_workers.value,
+        engine: Engines = Engines.thread,
+        processes: int = 1,
     ) -> Results:
         """Assign the task to the host and then run it.
 
         :param viper.collections.Task task: The task to be assigned.
         :param str args: The arguments to be used to create the command
             from :py:attr:`viper.collections.Task.command_factory`.
-        :param int max_workers: Maximum number of thread workers.
+        :param int max_workers: Maximum number of workers (per process).
             if the value is <= 1, tasks will run in sequence.
+        :param viper.collections.Engines engine: The execution engine to use.
+        :param int processes: Number of worker processes to shard the hosts across.
 
         :rtype: viper.collections.Results
 
@@ -1107,7 +1548,9 @@ class Hosts(Items[Host]):
 
             Hosts.from_items(Host("1.2.3.4")).task_task(ping)
         """
-        return self.task(task, *args).run(max_workers=max_workers)
+        return self.task(task, *args).run(
+            max_workers=max_workers, engine=engine, processes=processes
+        )
 
     def results(self) -> Results:
         """Get the past results of this group of hosts from history.
@@ -1286,29 +1729,24 @@ class Runner(Item):
             return flatten_dict(dict_)
         return dict_
 
-    def run(self, retry: int = 0, trigger_time: t.Optional[float] = None) -> Result:
+    def run(
+        self,
+        retry: int = 0,
+        trigger_time: t.Optional[float] = None,
+        sink: t.Optional[ResultSink] = None,
+    ) -> Result:
         """Run the task on the host.
 
         :param int retry: Count of retries used.
         :param float trigger_time (optional): The trigger time used for grouping (auto generated).
+        :param viper.db.ResultSink sink (optional): Save the results via this sink.
 
         :rtype: viper.collections.Result
         """
         if not trigger_time:
             trigger_time = time()
 
-        if not all(isinstance(a, str) for a in self.args):
-            raise ValueError(f"{self.args}: args must be a list/tuple of strings.")
-
-        command = self.task.command_factory(self.host, *self.args)
-
-        if not command:
-            raise ValueError(
-                f"{self.task.command_factory} generated empty command ({command})."
-            )
-
-        if not all(isinstance(c, str) for c in command):
-            raise ValueError(f"{command}: command must be a list/tuple of strings.")
+        command = self._command()
 
         if self.task.pre_run:
             self.task.pre_run(self)
@@ -1328,6 +1766,98 @@ class Runner(Item):
 
         end = time()
 
+        result = self._result(
+            trigger_time, command, stdout, stderr, returncode, start, end, retry, sink
+        )
+
+        if result.errored() and result.retry_left():
+            return self.run(trigger_time=trigger_time, retry=retry + 1, sink=sink)
+
+        return result
+
+    async def run_async(
+        self,
+        retry: int = 0,
+        trigger_time: t.Optional[float] = None,
+        sink: t.Optional[ResultSink] = None,
+    ) -> Result:
+        """Run the task on the host using asyncio.
+
+        Same as :py:meth:`Runner.run`, but the command is executed using
+        :py:func:`asyncio.create_subprocess_exec` instead of blocking a thread.
+
+        :rtype: viper.collections.Result
+        """
+        if not trigger_time:
+            trigger_time = time()
+
+        command = self._command()
+
+        if self.task.pre_run:
+            self.task.pre_run(self)
+
+        start = time()
+
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+            try:
+                out, err = await asyncio.wait_for(
+                    proc.communicate(), timeout=self.task.timeout
+                )
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                timeout = t.cast(float, self.task.timeout)
+                raise subprocess.TimeoutExpired(command, timeout)
+
+            stdout, stderr = out.decode("latin1"), err.decode("latin1")
+            returncode = t.cast(int, proc.returncode)
+        except Exception as e:
+            stdout, stderr, returncode = "", str(e), 123
+
+        end = time()
+
+        result = self._result(
+            trigger_time, command, stdout, stderr, returncode, start, end, retry, sink
+        )
+
+        if result.errored() and result.retry_left():
+            return await self.run_async(
+                trigger_time=trigger_time, retry=retry + 1, sink=sink
+            )
+
+        return result
+
+    def _command(self) -> t.Tuple[str, ...]:
+        if not all(isinstance(a, str) for a in self.args):
+            raise ValueError(f"{self.args}: args must be a list/tuple of strings.")
+
+        command = self.task.command_factory(self.host, *self.args)
+
+        if not command:
+            raise ValueError(
+                f"{self.task.command_factory} generated empty command ({command})."
+            )
+
+        if not all(isinstance(c, str) for c in command):
+            raise ValueError(f"{command}: command must be a list/tuple of strings.")
+
+        return t.cast(t.Tuple[str, ...], command)
+
+    def _result(
+        self,
+        trigger_time: float,
+        command: t.Tuple[str, ...],
+        stdout: str,
+        stderr: str,
+        returncode: int,
+        start: float,
+        end: float,
+        retry: int,
+        sink: t.Optional[ResultSink],
+    ) -> Result:
         if self.task.stdout_processor is not None:
             stdout = self.task.stdout_processor(stdout)
 
@@ -1346,14 +1876,11 @@ class Runner(Item):
             start,
             end,
             retry,
-        ).save()
+        ).save(sink=sink)
 
         if self.task.post_run:
             self.task.post_run(result)
 
-        if result.errored() and result.retry_left():
-            return self.run(trigger_time=trigger_time, retry=retry + 1)
-
         return result
 
 
@@ -1362,40 +1889,215 @@ class Runners(Items[Runner]):
     _all: t.Sequence[Runner] = field(default_factory=tuple)
     _item_type: t.Type[Runner] = field(init=False, default=Runner)
 
-    def run(self, max_workers: int = Config.max_workers.value) -> Results:
+    def run(
+        self,
+        max_workers: int = Config.max_workers.value,
+        engine: Engines = Engines.thread,
+        processes: int = 1,
+        trigger_time: t.Optional[float] = None,
+    ) -> Results:
         """Run the tasks.
 
-        :param int max_workers: Maximum number of thread workers to use.
+        :param int max_workers: Maximum number of workers to use (per process).
+        :param viper.collections.Engines engine: The execution engine to use.
+        :param int processes: Number of worker processes to shard the runners across.
+            If the value is <= 1, everything runs in the current process.
+        :param float trigger_time (optional): The trigger time used for grouping (auto generated).
+
+        :rtype: viper.collections.Results
+
+        The results are saved in batches by a single writer thread
+        (see :py:class:`viper.db.ResultSink`) and all of them are
+        guaranteed to be saved by the time this method returns.
+
+        When running with multiple processes, each process rebuilds its share
+        of the runners from JSON, runs them using its own pool of ``max_workers``
+        and saves the results, which are then merged back.
+
+        See :py:meth:`Runners.iter_run` to get the results as soon as they complete.
+        """
+
+        return Results.from_items(
+            self.iter_run(
+                max_workers=max_workers,
+                engine=engine,
+                processes=processes,
+                trigger_time=trigger_time,
+            )
+        )
+
+    def iter_run(
+        self,
+        max_workers: int = Config.max_workers.value,
+        engine: Engines = Engines.thread,
+        processes: int = 1,
+        trigger_time: t.Optional[float] = None,
+    ) -> t.Iterator[Result]:
+        """Run the tasks and yield the results as soon as they complete.
+
+        Takes the same parameters as :py:meth:`Runners.run`.
+
+        :rtype: generator
+
+        Only a bounded number of runners are in flight at a time, so the
+        memory usage does not grow with the number of runners as long as the
+        results are consumed. When running with multiple processes, the
+        results are yielded as each process finishes its share.
+
+        :example:
+
+        .. code-block:: python
+
+            for result in runners.iter_run(max_workers=50):
+                print(result.format("{host.hostname}: {stdout}"))
+        """
+
+        if not trigger_time:
+            trigger_time = time()
+
+        if processes > 1:
+            yield from self._iter_run_sharded(
+                max_workers, engine, processes, trigger_time
+            )
+            return
+
+        if engine is Engines.asyncio:
+            yield from self._iter_run_async(max_workers, trigger_time)
+            return
+
+        if engine is not Engines.thread:
+            raise ValueError(f"expecting enum {Engines}")
+
+        with ResultSink() as sink:
+            if max_workers <= 1:
+                # Run in sequence
+                for r in self._all:
+                    try:
+                        result = r.run(trigger_time=trigger_time, sink=sink)
+                    except Exception:  # pragma: no cover
+                        print(traceback.format_exc(), file=sys.stderr)
+                        continue
+                    yield result
+                return
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Run in parallel, keeping the pool busy while the results are consumed
+                runners = iter(self._all)
+
+                def submit(n: int) -> t.Set[Future[Result]]:
+                    return {
+                        executor.submit(r.run, trigger_time=trigger_time, sink=sink)
+                        for r in islice(runners, n)
+                    }
+
+                pending = submit(max_workers * 2)
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    pending |= submit(len(done))
+                    for f in done:
+                        try:
+                            result = f.result()
+                        except Exception:  # pragma: no cover
+                            print(traceback.format_exc(), file=sys.stderr)
+                            continue
+                        yield result
+
+    async def run_async(
+        self,
+        max_workers: int = Config.max_workers.value,
+        trigger_time: t.Optional[float] = None,
+    ) -> Results:
+        """Run the tasks using asyncio.
+
+        :param int max_workers: Maximum number of concurrent commands.
+            if the value is <= 1, tasks will run in sequence.
+        :param float trigger_time (optional): The trigger time used for grouping (auto generated).
 
         :rtype: viper.collections.Results
+
+        A fixed number of worker coroutines share the runners, so the memory
+        usage does not grow with the number of runners. The retries, callbacks
+        and the results are handled the same way as in :py:meth:`Runners.run`.
         """
 
-        trigger_time = time()
+        results: t.List[Result] = []
+        await self._run_async(max_workers, trigger_time, results.append)
+        return Results.from_items(*results)
+
+    async def _run_async(
+        self,
+        max_workers: int,
+        trigger_time: t.Optional[float],
+        callback: t.Callable[[Result], object],
+    ) -> None:
+        if not trigger_time:
+            trigger_time = time()
+
+        runners = iter(self._all)
 
-        if max_workers <= 1:
-            # Run in sequence
-            results = []
-            for r in self._all:
+        async def worker() -> None:
+            for r in runners:
                 try:
-                    results.append(r.run(trigger_time=trigger_time))
+                    callback(await r.run_async(trigger_time=trigger_time, sink=sink))
                 except Exception:  # pragma: no cover
                     print(traceback.format_exc(), file=sys.stderr)
-            return Results.from_items(*results)
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Run in parallel
+        with ResultSink() as sink:
+            await asyncio.gather(*(worker() for _ in range(max(1, max_workers))))
+
+    def _iter_run_async(
+        self, max_workers: int, trigger_time: float
+    ) -> t.Iterator[Result]:
+        # The event loop runs in its own thread and hands over the results
+        results: Queue[t.Optional[Result]] = Queue()
+        errors: t.List[BaseException] = []
+
+        def loop() -> None:
+            try:
+                asyncio.run(self._run_async(max_workers, trigger_time, results.put))
+            except BaseException as e:  # pragma: no cover
+                errors.append(e)
+            finally:
+                results.put(None)
+
+        thread = Thread(target=loop, daemon=True)
+        thread.start()
+
+        for result in iter(results.get, None):
+            yield result
+
+        thread.join()
+        if errors:  # pragma: no cover
+            raise errors[0]
+
+    def _iter_run_sharded(
+        self, max_workers: int, engine: Engines, processes: int, trigger_time: float
+    ) -> t.Iterator[Result]:
+        shards = [self._all[i::processes] for i in range(processes)]
+        shards = [s for s in shards if s]
+
+        with ProcessPoolExecutor(
+            max_workers=len(shards) or 1,
+            initializer=_init_shard_worker,
+            initargs=(sys.path,),
+        ) as executor:
             futures = [
-                executor.submit(r.run, **{"trigger_time": trigger_time})
-                for r in self._all
+                executor.submit(
+                    _run_shard,
+                    [r.to_dict() for r in shard],
+                    max_workers,
+                    engine,
+                    trigger_time,
+                )
+                for shard in shards
             ]
-            results = []
             for f in as_completed(futures):
                 try:
-                    results.append(f.result())
+                    rows = f.result()
                 except Exception:  # pragma: no cover
                     print(traceback.format_exc(), file=sys.stderr)
-
-        return Results.from_items(*results)
+                    continue
+                yield from Results.from_rows(rows).all()
 
     def hosts(self) -> Hosts:
         """Get the list of hosts from the runners.
@@ -1423,42 +2125,22 @@ class Result(Item):
 
     @classmethod
     def by_id(cls, id_: int) -> Result:
-        """Fetch the result from DB by hash.
+        """Fetch the result from DB by ID.
 
-        :param int hash_: The hash value.
+        :param int id_: The ID of the result.
 
         :rtype: viper.collections.Result
         """
 
         with ViperDB(ViperDB.url) as conn:
-
-            data = next(
-                conn.execute(
-                    """
-                    SELECT
-                        trigger_time, task, host, args, command, stdout, stderr,
-                        returncode, start, end, retry
-                    FROM results WHERE id = ?
-                    """,
-                    (id_,),
-                )
+            results = Results.from_rows(
+                select_results(conn, where=["id = ?"], params=[id_])
             )
 
-        return cls.from_dict(
-            dict(
-                trigger_time=data[0],
-                task=loadjson(data[1]),
-                host=loadjson(data[2]),
-                args=loadjson(data[3]),
-                command=loadjson(data[4]),
-                stdout=data[5],
-                stderr=data[6],
-                returncode=data[7],
-                start=data[8],
-                end=data[9],
-                retry=data[10],
-            )
-        )
+        if not results:
+            raise ValueError(f"{id_}: result not found")
+
+        return results.all()[0]
 
     @classmethod
     def from_dict(
@@ -1531,40 +2213,47 @@ class Result(Item):
         """
         return self.task.retry - self.retry
 
-    def save(self) -> Result:
+    def save(self, sink: t.Optional[ResultSink] = None) -> Result:
         """Save the result in DB.
 
+        :param viper.db.ResultSink sink (optional): Push the result to this
+            sink instead of writing it immediately.
+
         :rtype: viper.collections.Result
         """
 
+        if sink is not None:
+            sink.put(self.to_row())
+            return self
+
         with ViperDB() as conn:
-            conn.execute(
-                """
-                INSERT INTO results (
-                    hash, trigger_time, task, host, args, command,
-                    stdout, stderr, returncode, start, end, retry
-                ) VALUES (
-                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-                )
-                """,
-                (
-                    self.hash(),
-                    self.trigger_time,
-                    self.task.to_json(),
-                    self.host.to_json(),
-                    dumpjson(self.args),
-                    dumpjson(self.command),
-                    self.stdout,
-                    self.stderr,
-                    self.returncode,
-                    self.start,
-                    self.end,
-                    self.retry,
-                ),
-            )
+            insert_results(conn, [self.to_row()])
 
         return self
 
+    def to_row(self) -> RowType:
+        """Represent the result as a row of the results table.
+
+        :rtype: tuple
+        """
+        return (
+            self.hash(),
+            self.trigger_time,
+            self.task.to_json(),
+            self.host.to_json(),
+            dumpjson(self.args),
+            dumpjson(self.command),
+            self.stdout,
+            self.stderr,
+            self.returncode,
+            self.start,
+            self.end,
+            self.retry,
+            self.host.ip,
+            self.host.hostname,
+            self.task.name,
+        )
+
     def runner(self) -> Runner:
         """Recreate the runner from the result.
 
@@ -1581,57 +2270,183 @@ class Results(Items[Result]):
     _item_type: t.Type[Result] = field(init=False, default=Result)
 
     @classmethod
-    def from_history(cls: t.Type[Results], final: bool = False) -> Results:
+    def from_rows(cls: t.Type[Results], rows: t.Iterable[RowType]) -> Results:
+        """Create the results from the rows selected by :py:func:`viper.db.select_results`.
+
+        The rows are consumed lazily, and the tasks and hosts are parsed only
+        once per distinct JSON value.
+
+        :param iterable rows: The rows selected from the results table.
+        :rtype: viper.collections.Results
+        """
+        return cls.from_items(cls._load_rows(rows))
+
+    @staticmethod
+    def _load_rows(rows: t.Iterable[RowType]) -> t.Iterator[Result]:
+        tasks: t.Dict[str, Task] = {}
+        hosts: t.Dict[str, Host] = {}
+
+        for row in rows:
+            task, host = row[2], row[3]
+
+            if task not in tasks:
+                tasks[task] = Task.from_dict(loadjson(task))
+
+            if host not in hosts:
+                hosts[host] = Host.from_dict(loadjson(host))
+
+            yield Result(
+                trigger_time=row[1],
+                task=tasks[task],
+                host=hosts[host],
+                args=tuple(loadjson(row[4])),
+                command=tuple(loadjson(row[5])),
+                stdout=row[6],
+                stderr=row[7],
+                returncode=row[8],
+                start=row[9],
+                end=row[10],
+                retry=row[11],
+            )
+
+    @classmethod
+    def from_history(
+        cls: t.Type[Results],
+        final: bool = False,
+        *,
+        where: t.Optional[Query] = None,
+        order_by: t.Sequence[str] = (),
+        reverse: bool = False,
+        limit: t.Optional[int] = None,
+        offset: t.Optional[int] = None,
+        since: t.Optional[float] = None,
+        until: t.Optional[float] = None,
+    ) -> Results:
         """Fetch and return all the results from history.
 
-        :rtype: ciper.collections.Results
+        :param bool final: Get the final results only (ignoring the previous retries).
+        :param viper.collections.Query where (optional): Fetch the matching results only.
+        :param list order_by (optional): Order the results by these properties.
+        :param bool reverse: Reverse the order.
+        :param int limit (optional): Fetch at most this many results.
+        :param int offset (optional): Skip this many results.
+        :param float since (optional): Fetch the results triggered at or after this time.
+        :param float until (optional): Fetch the results triggered before this time.
+
+        :rtype: viper.collections.Results
+
+        The results are ordered by the start time, latest first, unless
+        ``order_by`` is given. The conditions, order and limits are applied in
+        SQL wherever possible, so that only the matching results are loaded.
+        The rest of the query is applied in Python on the selected results.
+
+        :example:
+
+        .. code-block:: python
+
+            Results.from_history(
+                where=Where("returncode", WhereConditions.is_not, ["0"]),
+                order_by=["host.ip"],
+                limit=10,
+            )
         """
+
+        where_sql = None if where is None or final else _where_sql(where)
+        order_sql = None if final else _order_by_sql(order_by, reverse)
+
+        exact = where is None or (where_sql is not None and where_sql[2])
+        in_sql = not final and exact and order_sql is not None
+
         with ViperDB(ViperDB.url) as conn:
-            rows = conn.execute("SELECT id FROM results ORDER BY start DESC")
-            result_list = [cls._item_type.by_id(r[0]) for r in rows]
+            rows = select_results(
+                conn,
+                where=[where_sql[0]] if where_sql else [],
+                params=where_sql[1] if where_sql else [],
+                order_by=order_sql or "start DESC",
+                limit=limit if in_sql else None,
+                offset=offset if in_sql else None,
+                since=since,
+                until=until,
+            )
+            results: t.Iterable[Result] = cls._load_rows(rows)
+
+            if final:
+                results = cls.from_items(results).final().all()
+
+            if where is not None and not exact:
+                results = filter(where.predicate(), results)
+
+            if order_by and order_sql is None:
+                results = (
+                    cls.from_items(results).order_by(*order_by, reverse=reverse).all()
+                )
+
+            if not in_sql and (limit is not None or offset):
+                start = offset or 0
+                stop = None if limit is None else start + limit
+                results = islice(results, start, stop)
 
-        results = cls.from_items(*result_list)
-        return results.final() if final else results
+            return cls.from_items(results)
 
     @classmethod
-    def by_host(cls, host: Host) -> Results:
+    def by_host(
+        cls,
+        host: Host,
+        *,
+        limit: t.Optional[int] = None,
+        offset: t.Optional[int] = None,
+        since: t.Optional[float] = None,
+        until: t.Optional[float] = None,
+    ) -> Results:
         """Fetch and return results from history of the given host.
 
         :param viper.collections.Host host: Fetch results of this host.
         :rtype: viper.collections.Results
+
+        See :py:meth:`Results.from_history` for the other parameters.
         """
         with ViperDB(ViperDB.url) as conn:
-            rows = conn.execute(
-                f"""
-                SELECT id FROM results
-                WHERE JSON_EXTRACT(host, '$.ip') = ?
-                ORDER BY start DESC
-                """,
-                (host.ip,),
+            return cls.from_rows(
+                select_results(
+                    conn,
+                    where=["host_ip = ?"],
+                    params=[host.ip],
+                    limit=limit,
+                    offset=offset,
+                    since=since,
+                    until=until,
+                )
             )
-            results = [cls._item_type.by_id(r[0]) for r in rows]
-
-        return cls.from_items(*results)
 
     @classmethod
-    def by_task(cls, task: Task) -> Results:
+    def by_task(
+        cls,
+        task: Task,
+        *,
+        limit: t.Optional[int] = None,
+        offset: t.Optional[int] = None,
+        since: t.Optional[float] = None,
+        until: t.Optional[float] = None,
+    ) -> Results:
         """Fetch and return results from history of the given task.
 
-        :param viper.collections.Host host: Fetch results of this task.
+        :param viper.collections.Task task: Fetch results of this task.
         :rtype: viper.collections.Results
+
+        See :py:meth:`Results.from_history` for the other parameters.
         """
         with ViperDB(ViperDB.url) as conn:
-            rows = conn.execute(
-                f"""
-                SELECT id FROM results
-                WHERE JSON_EXTRACT(task, '$.name') = ?
-                ORDER BY start DESC
-                """,
-                (task.name,),
+            return cls.from_rows(
+                select_results(
+                    conn,
+                    where=["task_name = ?"],
+                    params=[task.name],
+                    limit=limit,
+                    offset=offset,
+                    since=since,
+                    until=until,
+                )
             )
-            results = [cls._item_type.by_id(r[0]) for r in rows]
-
-        return cls.from_items(*results)
 
     def hosts(self) -> Hosts:
         """Get the list of hosts from the results.
@@ -1672,9 +2487,37 @@ class Results(Items[Result]):
         """
         return Runners.from_items(r.runner() for r in self._all)
 
-    def re_run(self, max_workers: int = Config.max_workers.value) -> Results:
+    def re_run(
+        self,
+        max_workers: int = Config.max_workers.value,
+        engine: Engines = Engines.thread,
+        processes: int = 1,
+    ) -> Results:
         """Recreate the runners from the results and run again.
 
+        See :py:meth:`Runners.run` for the parameters.
+
         :rtype: viper.collections.Results
         """
-        return self.runners().run(max_workers=max_workers)
+        return self.runners().run(
+            max_workers=max_workers, engine=engine, processes=processes
+        )
+
+
+def _init_shard_worker(path: t.List[str]) -> None:
+    # Make sure the tasks can be located the same way as in the parent process
+    sys.path[:] = path
+
+
+def _run_shard(
+    runners: t.List[t.Dict[object, object]],
+    max_workers: int,
+    engine: Engines,
+    trigger_time: float,
+) -> t.List[RowType]:
+    results = Runners.from_list(runners).run(
+        max_workers=max_workers, engine=engine, trigger_time=trigger_time
+    )
+
+    # From the second column on, the rows match the ones selected from DB
+    return [(None,) + r.to_row()[1:12] for r in results.all()]
@@ -11,5 +11,10 @@ class Config(Enum):
     """Default viper configuration."""
 
     db_url = env.get("VIPER_DB_URL", "viperdb.sqlite3")
+    db_batch_size = int(env.get("VIPER_DB_BATCH_SIZE", 500))
+    db_flush_interval = float(env.get("VIPER_DB_FLUSH_INTERVAL", 1.0))
+    db_layout = env.get("VIPER_DB_LAYOUT", "inline")
+    db_timeout = float(env.get("VIPER_DB_TIMEOUT", 60.0))
     max_workers = int(env.get("VIPER_MAX_WORKERS", 0))
+    stream = env.get("VIPER_STREAM", "0")
     modules_path = path.expanduser(env.get("VIPER_MODULES_PATH", "."))
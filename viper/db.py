@@ -1,12 +1,101 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from dataclasses import field
+from hashlib import blake2b
+from queue import Empty
+from queue import Queue
 from sqlite3 import Cursor
+from threading import Thread
+from time import monotonic
 from viper.const import Config
 
 import sqlite3
 import typing as t
 
+RowType = t.Tuple[t.Any, ...]
+
+_STOP = object()
+
+# The schema migrations, in order. The schema version of a database
+# (stored as ``PRAGMA user_version``) is the number of migrations applied.
+MIGRATIONS: t.Sequence[t.Sequence[str]] = (
+    # 1: Denormalized and indexed columns for the frequent lookups
+    (
+        "ALTER TABLE results ADD COLUMN host_ip TEXT",
+        "ALTER TABLE results ADD COLUMN host_hostname TEXT",
+        "ALTER TABLE results ADD COLUMN task_name TEXT",
+        """
+        UPDATE results SET
+            host_ip = JSON_EXTRACT(host, '$.ip'),
+            host_hostname = JSON_EXTRACT(host, '$.hostname'),
+            task_name = JSON_EXTRACT(task, '$.name')
+        """,
+        "CREATE INDEX results_host_ip ON results (host_ip)",
+        "CREATE INDEX results_host_hostname ON results (host_hostname)",
+        "CREATE INDEX results_task_name ON results (task_name)",
+        "CREATE INDEX results_trigger_time ON results (trigger_time)",
+        "CREATE INDEX results_start ON results (start)",
+    ),
+    # 2: Deduplicated task and host tables referenced by the results
+    (
+        """
+        CREATE TABLE tasks (
+            digest TEXT PRIMARY KEY,
+            data JSON NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE hosts (
+            digest TEXT PRIMARY KEY,
+            data JSON NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE results_v2 (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            hash INTEGER NOT NULL,
+            trigger_time REAL NOT NULL,
+            task JSON,
+            host JSON,
+            args JSON NOT NULL,
+            command JSON NOT NULL,
+            stdout BLOB NOT NULL,
+            stderr BLOB NOT NULL,
+            returncode INTEGER NOT NULL,
+            start REAL NOT NULL,
+            end REAL NOT NULL,
+            retry INTEGER NOT NULL,
+            host_ip TEXT,
+            host_hostname TEXT,
+            task_name TEXT,
+            task_digest TEXT REFERENCES tasks (digest),
+            host_digest TEXT REFERENCES hosts (digest)
+        )
+        """,
+        """
+        INSERT INTO results_v2 (
+            id, hash, trigger_time, task, host, args, command, stdout, stderr,
+            returncode, start, end, retry, host_ip, host_hostname, task_name
+        )
+        SELECT
+            id, hash, trigger_time, task, host, args, command, stdout, stderr,
+            returncode, start, end, retry, host_ip, host_hostname, task_name
+        FROM results
+        """,
+        "DROP TABLE results",
+        "ALTER TABLE results_v2 RENAME TO results",
+        "CREATE INDEX results_host_ip ON results (host_ip)",
+        "CREATE INDEX results_host_hostname ON results (host_hostname)",
+        "CREATE INDEX results_task_name ON results (task_name)",
+        "CREATE INDEX results_trigger_time ON results (trigger_time)",
+        "CREATE INDEX results_start ON results (start)",
+    ),
+)
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+LAYOUTS = ("inline", "normalized")
+
 
 @dataclass
 class ViperDB:
@@ -18,7 +107,9 @@ class ViperDB:
     def init(cls, url: str, force: bool = False) -> None:
         if force:
             with cls(url) as conn:
-                conn.execute("DROP TABLE IF EXISTS results")
+                for table in ("results", "tasks", "hosts"):
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+                conn.execute("PRAGMA user_version = 0")
 
         with cls(url) as conn:
             conn.execute(
@@ -41,8 +132,38 @@ class ViperDB:
                 """
             )
 
+        cls.migrate(url)
+
+    @classmethod
+    def migrate(cls, url: str) -> t.Tuple[int, int]:
+        """Upgrade the database schema to the latest version in place.
+
+        Each migration is applied in its own transaction.
+
+        :param str url: The database URL.
+        :returns: The schema versions before and after the migration.
+        :rtype: tuple
+        """
+        with cls(url) as conn:
+            version = schema_version(conn)
+
+            if version > SCHEMA_VERSION:
+                raise RuntimeError(
+                    f"schema version {version} is not supported by this version of viper"
+                )
+
+            for i in range(version, SCHEMA_VERSION):
+                conn.execute("BEGIN")
+                for statement in MIGRATIONS[i]:
+                    conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {i + 1}")
+                conn.connection.commit()
+
+        return version, SCHEMA_VERSION
+
     def __enter__(self) -> Cursor:
-        self.engine = sqlite3.connect(self.url)
+        # Several processes may write to the same database concurrently
+        self.engine = sqlite3.connect(self.url, timeout=Config.db_timeout.value)
         return self.engine.cursor()
 
     def __exit__(
@@ -54,3 +175,268 @@ class ViperDB:
             except Exception:  # pragma: no cover
                 self.engine.rollback()
             self.engine.close()
+
+
+def schema_version(conn: Cursor) -> int:
+    """Get the schema version of the database.
+
+    :rtype: int
+    """
+    version: int = next(conn.execute("PRAGMA user_version"))[0]
+    return version
+
+
+def check_schema(conn: Cursor) -> None:
+    """Make sure that the database schema is up to date.
+
+    :raises: RuntimeError
+    """
+    if schema_version(conn) == SCHEMA_VERSION:
+        return
+
+    tables = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'results'"
+    )
+    if next(tables, None) is None:
+        raise RuntimeError("database is not initialized, run `viper init`")
+
+    raise RuntimeError("database schema is outdated, run `viper db:migrate`")
+
+
+def digest(data: str) -> str:
+    """Get the content digest of the given text.
+
+    :rtype: str
+    """
+    return blake2b(data.encode(), digest_size=16).hexdigest()
+
+
+def insert_results(
+    conn: Cursor, rows: t.Sequence[RowType], layout: str = Config.db_layout.value
+) -> None:
+    """Insert the given result rows using a single statement.
+
+    Each row should contain the values for the columns ``hash``, ``trigger_time``,
+    ``task``, ``host``, ``args``, ``command``, ``stdout``, ``stderr``,
+    ``returncode``, ``start``, ``end``, ``retry``, ``host_ip``, ``host_hostname``
+    and ``task_name`` in that order.
+
+    :param str layout: Either ``inline`` to store the task and host JSON in every
+        row, or ``normalized`` to store them once in the ``tasks`` and ``hosts``
+        tables, referenced by their digests.
+    """
+    check_schema(conn)
+
+    if layout not in LAYOUTS:
+        raise ValueError(f"{layout}: invalid layout, use one of {LAYOUTS}")
+
+    if layout == "normalized":
+        tasks: t.Dict[str, str] = {}
+        hosts: t.Dict[str, str] = {}
+
+        for row in rows:
+            if row[2] not in tasks:
+                tasks[row[2]] = digest(row[2])
+            if row[3] not in hosts:
+                hosts[row[3]] = digest(row[3])
+
+        conn.executemany(
+            "INSERT OR IGNORE INTO tasks (digest, data) VALUES (?, ?)",
+            ((d, data) for data, d in tasks.items()),
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO hosts (digest, data) VALUES (?, ?)",
+            ((d, data) for data, d in hosts.items()),
+        )
+
+        rows = [
+            row[:2] + (None, None) + row[4:] + (tasks[row[2]], hosts[row[3]])
+            for row in rows
+        ]
+    else:
+        rows = [row + (None, None) for row in rows]
+
+    conn.executemany(
+        """
+        INSERT INTO results (
+            hash, trigger_time, task, host, args, command,
+            stdout, stderr, returncode, start, end, retry,
+            host_ip, host_hostname, task_name, task_digest, host_digest
+        ) VALUES (
+            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+        )
+        """,
+        rows,
+    )
+
+
+def select_results(
+    conn: Cursor,
+    *,
+    where: t.Sequence[str] = (),
+    params: t.Sequence[object] = (),
+    order_by: str = "start DESC",
+    limit: t.Optional[int] = None,
+    offset: t.Optional[int] = None,
+    since: t.Optional[float] = None,
+    until: t.Optional[float] = None,
+) -> Cursor:
+    """Select the result rows in a single query.
+
+    The rows contain the columns ``id``, ``trigger_time``, ``task``, ``host``,
+    ``args``, ``command``, ``stdout``, ``stderr``, ``returncode``, ``start``,
+    ``end`` and ``retry`` in that order, with the task and host joined back from
+    the normalized tables where needed. The returned cursor should be consumed
+    while the connection is still open.
+
+    :param list where: SQL conditions to be joined with ``AND``.
+    :param list params: Parameters for the placeholders used in the conditions.
+    :param str order_by: The SQL ``ORDER BY`` clause.
+    :param int limit (optional): Maximum number of rows to select.
+    :param int offset (optional): Number of rows to skip.
+    :param float since (optional): Select the rows triggered at or after this time.
+    :param float until (optional): Select the rows triggered before this time.
+    """
+    check_schema(conn)
+
+    conditions = list(where)
+    values = list(params)
+
+    if since is not None:
+        conditions.append("trigger_time >= ?")
+        values.append(since)
+
+    if until is not None:
+        conditions.append("trigger_time < ?")
+        values.append(until)
+
+    query = """
+        SELECT
+            id, trigger_time,
+            COALESCE(task, tasks.data),
+            COALESCE(host, hosts.data),
+            args, command, stdout, stderr, returncode, start, end, retry
+        FROM results
+        LEFT JOIN tasks ON tasks.digest = task_digest
+        LEFT JOIN hosts ON hosts.digest = host_digest
+        """
+
+    if conditions:
+        query += " WHERE " + " AND ".join(f"({c})" for c in conditions)
+
+    query += f" ORDER BY {order_by}"
+
+    if limit is not None or offset is not None:
+        query += " LIMIT ? OFFSET ?"
+        values += [-1 if limit is None else limit, offset or 0]
+
+    return conn.execute(query, values)
+
+
+@dataclass
+class ResultSink:
+    """A write-behind sink for the result rows.
+
+    The rows pushed into the sink are written by a single writer thread
+    using one connection. The rows are inserted in batches of ``batch_size``
+    rows, or whatever is pending every ``flush_interval`` seconds, whichever
+    comes first. Everything pending is flushed when the sink is closed.
+
+    :param str url: The database URL.
+    :param int batch_size: Maximum number of rows to write in a single transaction.
+    :param float flush_interval: Maximum number of seconds a row may wait in the queue.
+    :param str layout: The storage layout (see :py:func:`insert_results`).
+
+    :example:
+
+    .. code-block:: python
+
+        with ResultSink() as sink:
+            result.save(sink=sink)
+    """
+
+    url: str = Config.db_url.value
+    batch_size: int = Config.db_batch_size.value
+    flush_interval: float = Config.db_flush_interval.value
+    layout: str = Config.db_layout.value
+    _queue: Queue[object] = field(init=False, default_factory=Queue)
+    _thread: t.Optional[Thread] = field(init=False, default=None)
+    _error: t.Optional[Exception] = field(init=False, default=None)
+
+    def __enter__(self) -> ResultSink:
+        self.start()
+        return self
+
+    def __exit__(
+        self, exc_type: type, exc_value: t.Any, exc_traceback: Exception
+    ) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Start the writer thread."""
+
+        if self.batch_size < 1:
+            raise ValueError(f"{self.batch_size}: batch size must be >= 1")
+
+        if self._thread is not None:
+            raise RuntimeError("the sink is already started")
+
+        self._thread = Thread(target=self._write, name="viper-result-sink")
+        self._thread.start()
+
+    def put(self, row: RowType) -> None:
+        """Push a row to be written.
+
+        :param tuple row: The row as expected by :py:func:`insert_results`.
+        """
+        if self._thread is None:
+            raise RuntimeError("the sink is not started")
+        self._queue.put(row)
+
+    def close(self) -> None:
+        """Flush the pending rows and stop the writer thread.
+
+        :raises: The error that stopped the writer thread, if any.
+        """
+        if self._thread is None:
+            return
+
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+        if self._error is not None:
+            raise RuntimeError(f"failed to save the results: {self._error}")
+
+    def _write(self) -> None:
+        batch: t.List[RowType] = []
+        stopped = False
+        deadline = monotonic() + self.flush_interval
+
+        try:
+            with ViperDB(self.url) as conn:
+                while not stopped:
+                    try:
+                        row = self._queue.get(timeout=max(0, deadline - monotonic()))
+                        if row is _STOP:
+                            stopped = True
+                        else:
+                            batch.append(t.cast(RowType, row))
+                    except Empty:
+                        pass
+
+                    timedout = monotonic() >= deadline
+                    if batch and (stopped or timedout or len(batch) >= self.batch_size):
+                        insert_results(conn, batch, layout=self.layout)
+                        conn.connection.commit()
+                        batch = []
+
+                    if timedout:
+                        deadline = monotonic() + self.flush_interval
+
+        except Exception as e:
+            self._error = e
+
+            # Discard the remaining rows until the sink is closed
+            while not stopped:
+                stopped = self._queue.get() is _STOP
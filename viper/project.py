@@ -92,8 +92,12 @@ from argparse import Namespace
 from collections.abc import Iterable
 from dataclasses import dataclass
 from dataclasses import field
+from viper.cli_base import add_stream_argument
+from viper.cli_base import collect_items
 from viper.cli_base import SubCommand
+from viper.cli_base import write_items
 from viper.collections import Collection as ViperCollection
+from viper.collections import Items as ViperItems
 from viper.collections import Hosts
 from viper.collections import Results
 
@@ -200,20 +204,27 @@ class Project:
                         for arg in args:
                             parser.add_argument(*arg[0], **arg[1])
                     parser.add_argument("-i", "--indent", type=int, default=None)
+                    add_stream_argument(parser)
 
                 def __call__(self, args: Namespace) -> int:
                     if not issubclass(fromtype, ViperCollection):
                         raise ValueError(f"{fromtype}: invalid fromtype")
 
-                    obj: C = fromtype.from_json(input()).pipe(
-                        lambda obj: func(obj, args)
-                    )
+                    stream = False
+                    if issubclass(fromtype, ViperItems):
+                        items, stream = collect_items(fromtype)
+                    else:
+                        items = fromtype.from_json(input())
+
+                    obj: C = items.pipe(lambda obj: func(obj, args))
                     if not isinstance(obj, totype):
                         raise ValueError(
                             f"invalid totype, expected {totype} but got {type(obj)}"
                         )
 
-                    if isinstance(obj, ViperCollection):
+                    if isinstance(obj, ViperItems):
+                        write_items(obj, stream or args.stream, indent=args.indent)
+                    elif isinstance(obj, ViperCollection):
                         print(obj.to_json(indent=args.indent))
                     else:
                         print(obj)
@@ -246,14 +257,16 @@ class Project:
                         for arg in args:
                             parser.add_argument(*arg[0], **arg[1])
                     parser.add_argument("-i", "--indent", type=int, default=None)
+                    add_stream_argument(parser)
 
                 def __call__(self, args: Namespace) -> int:
-                    results = func(Hosts.from_json(input()), args)
+                    hosts, stream = collect_items(Hosts)
+                    results = func(hosts, args)
                     if not isinstance(results, Results):
                         raise ValueError(
                             f"a job must return {Results} object but got {type(results)}"
                         )
-                    print(results.to_json(indent=args.indent))
+                    write_items(results, stream or args.stream, indent=args.indent)
                     return 0
 
             self.job_commands.append(JobCommand)